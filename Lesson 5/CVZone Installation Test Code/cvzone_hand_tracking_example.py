@@ -1,9 +1,15 @@
 # Hand tracking example
 from cvzone.HandTrackingModule import HandDetector
 import cv2
+import os
+import sys
+
+# The low-latency camera profile is shared with the Lesson 6 scripts
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Lesson 6"))
+from camera_profile import open_camera
 
 detector = HandDetector()
-cap = cv2.VideoCapture(0)
+cap = open_camera(0)
 
 while True:
     success, img = cap.read()
@@ -1,7 +1,19 @@
 # test_cvzone.py
-import cv2
-import cvzone
-from cvzone.HandTrackingModule import HandDetector
+import os
+import sys
+
+# The startup profiler lives in the Lesson 6 folder
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Lesson 6"))
+from fast_start import StartupProfiler, warm_up
+
+# Time each import and the detector setup (this is what every hand tracking script pays at startup)
+startup = StartupProfiler()
+with startup.step("import cv2"):
+    import cv2
+with startup.step("import cvzone"):
+    import cvzone
+with startup.step("import HandDetector"):
+    from cvzone.HandTrackingModule import HandDetector
 import numpy as np
 
 # Check versions (CVZone doesn't have __version__ attribute)
@@ -13,11 +25,18 @@ except AttributeError:
 print("OpenCV version:", cv2.__version__)
 
 # Test basic functionality
-detector = HandDetector()
+with startup.step("HandDetector()"):
+    detector = HandDetector()
 print("Hand detector initialized successfully!")
 
+# The first detection is slower than the rest - run it on a blank frame
+warm_up(detector, startup)
+
 # Test camera (optional - comment out if no camera)
-# cap = cv2.VideoCapture(0)
+# Uses the low-latency camera profile from the Lesson 6 folder
+# from camera_profile import open_camera
+# with startup.step("open camera"):
+#     cap = open_camera(0)
 # success, img = cap.read()
 # if success:
 #     print("Camera test successful!")
@@ -25,4 +44,5 @@ print("Hand detector initialized successfully!")
 #     print(f"Detected {len(hands)} hands")
 # cap.release()
 
+print(startup.report())
 print("CVZone installation test completed successfully!")
\ No newline at end of file
@@ -1,12 +1,31 @@
-from cvzone.HandTrackingModule import HandDetector
 import cv2
+from async_log import AsyncLogger
+from camera_profile import open_camera
+from fast_start import StartupProfiler, warm_up
+from vision_server import connect_hand_detector
 
-# Initialize the webcam to capture video
-# The '2' indicates the third camera connected to your computer; '0' would usually refer to the built-in camera
-cap = cv2.VideoCapture(0)
+# Time every startup step up to the first processed frame
+startup = StartupProfiler()
 
+# Initialize the webcam to capture video with the low-latency camera profile (MJPEG, 1-frame buffer)
+# The '2' would indicate the third camera connected to your computer; '0' would usually refer to the built-in camera
 # Initialize the HandDetector class with the given parameters
-detector = HandDetector(staticMode=False, maxHands=2, modelComplexity=1, detectionCon=0.5, minTrackCon=0.5)
+# (both at the same time - cvzone and MediaPipe are imported while the camera opens,
+# or the detector attaches to vision_server.py in milliseconds if it is running)
+parts = startup.run_parallel({
+    "camera": lambda: open_camera(0),
+    "hand model": lambda: connect_hand_detector(staticMode=False, maxHands=2, modelComplexity=1,
+                                                detectionCon=0.5, minTrackCon=0.5),
+})
+cap = parts["camera"]
+detector = parts["hand model"]
+
+# Run the model once on a blank frame so the first real frame is not slow
+warm_up(detector, startup)
+
+# Finger counts are printed by a background writer (at most 5 lines per second, repeats merged)
+# so a slow console never holds up the next frame
+logger = AsyncLogger(max_rate=5)
 
 # Continuously get frames from the webcam
 while True:
@@ -19,6 +38,12 @@ while True:
     # The 'flipType' parameter flips the image, making it easier for some detections
     hands, img = detector.findHands(img, draw=True, flipType=True)
 
+    # Print the startup breakdown once the first frame has been processed
+    if startup is not None:
+        startup.mark("first frame")
+        print(startup.report())
+        startup = None
+
     # Check if any hands are detected
     if hands:
         # Information for the first hand detected
@@ -30,7 +55,6 @@ while True:
 
         # Count the number of fingers up for the first hand
         fingers1 = detector.fingersUp(hand1)
-        print(f'H1 = {fingers1.count(1)}', end=" ")  # Print the count of fingers that are up
 
         # Calculate distance between specific landmarks on the first hand and draw it on the image
         length, info, img = detector.findDistance(lmList1[8][0:2], lmList1[12][0:2], img, color=(255, 0, 255),
@@ -47,13 +71,16 @@ while True:
 
             # Count the number of fingers up for the second hand
             fingers2 = detector.fingersUp(hand2)
-            print(f'H2 = {fingers2.count(1)}', end=" ")
 
             # Calculate distance between the index fingers of both hands and draw it on the image
             length, info, img = detector.findDistance(lmList1[8][0:2], lmList2[8][0:2], img, color=(255, 0, 0),
                                                       scale=10)
 
-        print(" ")  # New line for better readability of the printed output
+            # Print the count of fingers that are up on both hands
+            logger.log("H1 = {h1} H2 = {h2}", h1=fingers1.count(1), h2=fingers2.count(1))
+        else:
+            # Print the count of fingers that are up
+            logger.log("H1 = {h1}", h1=fingers1.count(1))
 
     # Display the image in a window
     cv2.imshow("Image", img)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Rate-Limited Logger
+- The vision loop only puts a small record on a queue - it never waits for
+  the console (a slow SSH session or serial console cannot stall it)
+- A background thread formats and writes the lines
+- Identical lines in a row are merged into one "(N repeats)" line
+- At most max_rate lines per second are written; when lines come in faster,
+  the newest one is written next and the ones in between are skipped
+- event() lines (quality changes, watchdog trips...) are written as soon as the
+  writer gets them and are never skipped
+"""
+
+import queue
+import sys
+import threading
+from time import monotonic
+
+
+class AsyncLogger:
+    """Queue log records to a background writer thread"""
+
+    def __init__(self, max_rate=5.0, stream=None, queue_size=1000):
+        self.max_rate = max_rate          # Most lines written per second
+        self.stream = stream or sys.stdout
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.running = True
+        self.thread = threading.Thread(target=self._writer, daemon=True)
+
+        # Statistics
+        self.queued = 0
+        self.written = 0
+        self.coalesced = 0   # Identical lines merged into a repeats line
+        self.skipped = 0     # Lines skipped by the rate limit
+        self.overflow = 0    # Records dropped because the queue was full
+
+        self.thread.start()
+
+    def log(self, template, **fields):
+        """Queue a line like template.format(**fields) - never blocks"""
+        try:
+            self.queue.put_nowait((template, fields))
+            self.queued += 1
+        except queue.Full:
+            self.overflow += 1
+
+    def event(self, line):
+        """Queue a one-off line that the rate limit never skips - never blocks"""
+        try:
+            self.queue.put_nowait((None, line))
+            self.queued += 1
+        except queue.Full:
+            self.overflow += 1
+
+    def _writer(self):
+        """Background thread: coalesce, rate limit and write lines"""
+        last_line = None   # Last line written
+        repeats = 0        # Times last_line came in again since it was written
+        pending = None     # Newest different line waiting for the rate limit
+        next_allowed = 0.0
+
+        while self.running or not self.queue.empty() or pending is not None:
+            wait = max(0.0, next_allowed - monotonic()) if pending is not None else 0.1
+            try:
+                template, fields = self.queue.get(timeout=wait or 0.001)
+                if template is None:
+                    # An event - write it straight away, outside the rate limit
+                    if repeats:
+                        self._write(f"  ({repeats} repeats)")
+                    self._write(fields)
+                    last_line, repeats = None, 0
+                    continue
+                line = template.format(**fields)
+                if line == last_line and pending is None:
+                    repeats += 1
+                    self.coalesced += 1
+                else:
+                    if pending is not None:
+                        self.skipped += 1
+                    pending = line
+            except queue.Empty:
+                if not self.running and pending is None:
+                    break
+
+            now = monotonic()
+            if pending is not None and (now >= next_allowed or not self.running):
+                if repeats:
+                    self._write(f"  ({repeats} repeats)")
+                self._write(pending)
+                last_line, pending, repeats = pending, None, 0
+                next_allowed = now + 1.0 / self.max_rate
+
+        if repeats:
+            self._write(f"  ({repeats} repeats)")
+
+    def _write(self, line):
+        """Write one line to the stream"""
+        try:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+            self.written += 1
+        except (OSError, ValueError):
+            pass  # Console gone (e.g. SSH closed) - keep the vision loop running
+
+    def close(self):
+        """Write anything still queued and stop the writer thread"""
+        self.running = False
+        self.thread.join(timeout=2.0)
+
+    def stats(self):
+        """Return logger statistics as a dictionary"""
+        return {"queued": self.queued, "written": self.written, "coalesced": self.coalesced,
+                "skipped": self.skipped, "overflow": self.overflow}
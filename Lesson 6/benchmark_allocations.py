@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Frame Allocation Benchmark
+- Runs the capture + preprocessing steps of the Lesson 6 loops two ways:
+  new images every frame (cap.read, cv2.resize, cv2.cvtColor) and
+  reused buffers (FrameGrabber with reuse_buffers, FramePreprocessor)
+- Reports new image buffers and megabytes allocated per frame
+  (NumPy reports its allocations to tracemalloc; the peak above the
+  starting memory is taken for every frame)
+- No hand detection - only the memory traffic around it is measured
+
+Usage:
+    python3 benchmark_allocations.py
+    python3 benchmark_allocations.py --source clip.mp4 --scale 0.5
+"""
+
+import argparse
+import tracemalloc
+from time import perf_counter
+
+import cv2
+
+from camera_profile import open_camera
+from frame_buffers import FramePreprocessor
+from frame_grabber import FrameGrabber
+
+
+class FrameMeter:
+    """Memory allocated during each frame, from tracemalloc's peak"""
+
+    def __init__(self):
+        self.frames = 0
+        self.allocated = 0
+        self.start = 0
+
+    def frame_start(self):
+        tracemalloc.reset_peak()
+        self.start = tracemalloc.get_traced_memory()[0]
+
+    def frame_end(self):
+        self.allocated += tracemalloc.get_traced_memory()[1] - self.start
+        self.frames += 1
+
+
+def run_allocating(cap, frames, scale, meter):
+    """Capture and preprocess with a new image at every step"""
+    for _ in range(frames):
+        meter.frame_start()
+        success, img = cap.read()
+        if not success:
+            break
+        height, width = img.shape[:2]
+        if scale < 1.0:
+            img = cv2.resize(img, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        meter.frame_end()
+    # A new frame, a resized copy and an RGB copy every frame
+    return meter.frames * (3 if scale < 1.0 else 2)
+
+
+def run_reused(cap, frames, scale, meter):
+    """Capture and preprocess into reused buffers, returns the allocation counters"""
+    grabber = FrameGrabber(cap, threaded=False, reuse_buffers=True).start()
+    preprocess = FramePreprocessor()
+    for _ in range(frames):
+        meter.frame_start()
+        success, img = grabber.read()
+        if not success:
+            break
+        preprocess.to_rgb(img, scale)
+        meter.frame_end()
+    return grabber.allocations + preprocess.allocations
+
+
+def measure(name, run, source, frames, scale):
+    """Run one variant and print allocations per frame"""
+    cap = open_camera(source, report=False)
+    meter = FrameMeter()
+
+    tracemalloc.start()
+    start = perf_counter()
+    buffers = run(cap, frames, scale, meter)
+    elapsed = perf_counter() - start
+    tracemalloc.stop()
+    cap.release()
+
+    if meter.frames == 0:
+        print(f"{name:>10} no frames read")
+        return
+    allocated_mb = meter.allocated / meter.frames / 1024 / 1024
+    print(f"{name:>10} {buffers / meter.frames:>9.2f} {allocated_mb:>10.3f} "
+          f"{elapsed / meter.frames * 1000:>9.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare frame allocations per frame")
+    parser.add_argument("--source", default="0", help="camera index or video file (default: 0)")
+    parser.add_argument("--frames", type=int, default=200, help="frames per variant")
+    parser.add_argument("--scale", type=float, default=0.5, help="inference scale (default: 0.5)")
+    args = parser.parse_args()
+
+    source = int(args.source) if args.source.isdigit() else args.source
+    print(f"{args.frames} frames from {args.source} at scale {args.scale}")
+    print(f"{'Variant':>10} {'Buffers':>9} {'MB/frame':>10} {'Time':>11}")
+    measure("allocating", run_allocating, source, args.frames, args.scale)
+    measure("reused", run_reused, source, args.frames, args.scale)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Inference Scale Benchmark
+- Records a short clip from the camera (or reads a video file)
+- Runs hand detection at several inference scales on the same frames
+- Reports FPS and how often the finger count agrees with full resolution
+- Use it to pick the fastest scale that still counts fingers correctly
+
+Usage:
+    python3 benchmark_inference_scale.py
+    python3 benchmark_inference_scale.py --source clip.mp4 --scales 1.0 0.5 0.25
+"""
+
+import argparse
+from time import perf_counter
+
+from cvzone.HandTrackingModule import HandDetector
+
+from scaled_hand_detector import ScaledHandDetector
+from camera_profile import open_camera
+
+
+def load_frames(source, max_frames):
+    """Read up to max_frames frames from a camera index or video file"""
+    cap = open_camera(int(source) if source.isdigit() else source)
+    frames = []
+    while len(frames) < max_frames:
+        success, img = cap.read()
+        if not success:
+            break
+        frames.append(img)
+    cap.release()
+    return frames
+
+
+def run_scale(frames, scale):
+    """Return (fps, finger counts per frame) for one inference scale"""
+    # A fresh detector per scale so MediaPipe tracking state is not shared
+    detector = ScaledHandDetector(
+        HandDetector(staticMode=False, maxHands=2, modelComplexity=1, detectionCon=0.5, minTrackCon=0.5),
+        scale=scale)
+
+    counts = []
+    start = perf_counter()
+    for img in frames:
+        hands, _ = detector.findHands(img.copy(), draw=False, flipType=True)
+        counts.append(detector.fingersUp(hands[0]).count(1) if hands else None)
+    elapsed = perf_counter() - start
+
+    return len(frames) / elapsed, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep hand detection inference scales")
+    parser.add_argument("--source", default="0", help="camera index or video file (default: 0)")
+    parser.add_argument("--frames", type=int, default=150, help="number of frames to test")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1.0, 0.75, 0.5, 0.35, 0.25])
+    args = parser.parse_args()
+
+    print(f"Loading {args.frames} frames from {args.source}...")
+    frames = load_frames(args.source, args.frames)
+    if not frames:
+        print("Failed to read from camera")
+        return
+    height, width = frames[0].shape[:2]
+    print(f"Loaded {len(frames)} frames at {width}x{height}")
+
+    # Full resolution is the reference for finger counts
+    _, reference = run_scale(frames, 1.0)
+
+    print(f"\n{'Scale':>6} {'Size':>10} {'FPS':>7} {'Agreement':>10}")
+    for scale in args.scales:
+        fps, counts = run_scale(frames, scale)
+        agree = sum(1 for ref, count in zip(reference, counts) if ref == count)
+        size = f"{int(width * min(scale, 1.0))}x{int(height * min(scale, 1.0))}"
+        print(f"{scale:>6.2f} {size:>10} {fps:>7.1f} {agree / len(frames) * 100:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+PWM Backend Benchmark
+- Compares gpiozero's software PWM with the sysfs hardware PWM (hardware_pwm.py)
+  on the L298N enable pin
+- CPU: process CPU time while the PWM runs at 50% duty cycle
+- Write time: how long one .value update takes (mean and worst case)
+- Jitter (optional): wire the PWM pin to a spare input pin with --loopback-pin,
+  the benchmark timestamps rising edges and reports the spread of the periods
+- --load starts busy processes to stand in for hand detection load
+- --fake runs the hardware backend against a fake sysfs tree (no Pi needed)
+
+Usage:
+    python3 benchmark_pwm.py
+    python3 benchmark_pwm.py --load 3 --loopback-pin 25 --frequency 100
+"""
+
+import argparse
+import multiprocessing as mp
+import statistics
+import tempfile
+from time import monotonic, perf_counter, process_time, sleep
+
+from hardware_pwm import HardwarePWM, create_fake_sysfs, SYSFS_PWM
+
+
+def busy_worker(stop):
+    """Spin until told to stop (stands in for a vision process)"""
+    while not stop.is_set():
+        sum(i * i for i in range(10000))
+
+
+def measure_cpu(pwm, seconds):
+    """Return process CPU use in percent while the PWM runs at 50%"""
+    pwm.value = 0.5
+    wall = monotonic()
+    cpu = process_time()
+    sleep(seconds)
+    return (process_time() - cpu) / (monotonic() - wall) * 100
+
+
+def measure_writes(pwm, count=1000):
+    """Return (mean, max) time in microseconds for one .value write"""
+    times = []
+    for i in range(count):
+        value = (i % 100) / 100
+        t0 = perf_counter()
+        pwm.value = value
+        times.append((perf_counter() - t0) * 1_000_000)
+    return statistics.mean(times), max(times)
+
+
+def measure_jitter(pwm, loopback_pin, seconds):
+    """Return (mean period, period standard deviation) in microseconds from looped-back edges"""
+    from gpiozero import DigitalInputDevice
+
+    edges = []
+    sensor = DigitalInputDevice(loopback_pin)
+    sensor.when_activated = lambda: edges.append(perf_counter())
+    pwm.value = 0.5
+    sleep(seconds)
+    sensor.close()
+
+    periods = [(b - a) * 1_000_000 for a, b in zip(edges, edges[1:])]
+    if len(periods) < 2:
+        return None
+    return statistics.mean(periods), statistics.stdev(periods)
+
+
+def run_backend(name, pwm, args):
+    """Measure one PWM backend and print a result line"""
+    cpu = measure_cpu(pwm, args.seconds)
+    write_mean, write_max = measure_writes(pwm)
+    line = f"{name:>9} {cpu:>6.1f}% {write_mean:>8.1f}us {write_max:>8.1f}us"
+    if args.loopback_pin is not None:
+        jitter = measure_jitter(pwm, args.loopback_pin, args.seconds)
+        if jitter is None:
+            line += f" {'no edges':>20}"
+        else:
+            line += f" {jitter[0]:>10.0f}us {jitter[1]:>8.1f}us"
+    pwm.value = 0
+    pwm.close()
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare software and hardware PWM")
+    parser.add_argument("--pin", type=int, default=18, help="PWM pin (default: 18, L298N ENA)")
+    parser.add_argument("--frequency", type=float, default=1000, help="PWM frequency in Hz")
+    parser.add_argument("--seconds", type=float, default=5.0, help="measurement time per test")
+    parser.add_argument("--load", type=int, default=0, help="busy processes to run alongside")
+    parser.add_argument("--loopback-pin", type=int, help="input pin wired to the PWM pin for jitter")
+    parser.add_argument("--chip", type=int, help="pwmchip number (default: the RP1 PWM0 controller)")
+    parser.add_argument("--fake", action="store_true", help="hardware backend on a fake sysfs tree only")
+    args = parser.parse_args()
+
+    ctx = mp.get_context("spawn")
+    stop = ctx.Event()
+    workers = [ctx.Process(target=busy_worker, args=(stop,), daemon=True) for _ in range(args.load)]
+    for worker in workers:
+        worker.start()
+
+    print(f"PWM on GPIO {args.pin} at {args.frequency:.0f} Hz | {args.load} busy processes")
+    header = f"{'Backend':>9} {'CPU':>7} {'Write':>10} {'Write max':>10}"
+    if args.loopback_pin is not None:
+        header += f" {'Period':>12} {'Jitter':>10}"
+    print(header)
+
+    try:
+        if args.fake:
+            root = create_fake_sysfs(tempfile.mkdtemp(prefix="fake_pwm_"))
+            run_backend("hardware", HardwarePWM(args.pin, frequency=args.frequency, root=root), args)
+            return
+
+        from gpiozero import PWMOutputDevice
+        run_backend("software", PWMOutputDevice(args.pin, frequency=args.frequency), args)
+
+        try:
+            pwm = HardwarePWM(args.pin, frequency=args.frequency, chip=args.chip, root=SYSFS_PWM)
+        except (RuntimeError, ValueError, OSError) as e:
+            print(f" hardware  unavailable: {e}")
+        else:
+            run_backend("hardware", pwm, args)
+    finally:
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Hand Detector Worker Pool
+- Runs several HandDetector instances in separate processes
+- Frames are handed out in turn (frame 0 to worker 0, frame 1 to worker 1, ...)
+- A reorder buffer puts the results back in capture order before the
+  finger counting and motor logic see them
+- max_in_flight limits how many frames can be waiting, so added latency stays bounded
+- A worker that dies raises RuntimeError (its frames would never come back), and
+  workers that stop answering raise TimeoutError, instead of waiting forever
+
+Benchmark (throughput for 1 to 4 workers):
+    python3 detector_pool.py
+    python3 detector_pool.py --source clip.mp4 --workers 1 2 3 4
+"""
+
+import argparse
+import multiprocessing as mp
+import queue
+from time import perf_counter
+
+import numpy as np
+
+from hand_utils import build_hand, fingers_up
+from pipeline_runner import SharedArray, HAND_TYPES, MAX_HANDS
+
+
+class ReorderBuffer:
+    """Hold results that finish early until every earlier frame is done"""
+
+    def __init__(self, first_id=0):
+        self.pending = {}
+        self.next_id = first_id
+
+    def push(self, frame_id, result):
+        """Add a result and return every (frame_id, result) now ready, in order"""
+        self.pending[frame_id] = result
+        ready = []
+        while self.next_id in self.pending:
+            ready.append((self.next_id, self.pending.pop(self.next_id)))
+            self.next_id += 1
+        return ready
+
+    def __len__(self):
+        return len(self.pending)
+
+
+def detector_worker(frames_spec, landmarks_spec, meta_spec, task_q, result_q, detector_kwargs):
+    """Worker process: detect hands in each frame slot it is given"""
+    from cvzone.HandTrackingModule import HandDetector
+
+    frames = SharedArray.attach(frames_spec)
+    landmarks = SharedArray.attach(landmarks_spec)
+    meta = SharedArray.attach(meta_spec)
+    detector = HandDetector(**detector_kwargs)
+
+    try:
+        while True:
+            task = task_q.get()
+            if task is None:
+                break
+            frame_id, slot = task
+
+            hands, _ = detector.findHands(frames.array[slot], draw=False, flipType=True)
+            meta.array[slot, :] = 0
+            meta.array[slot, 0] = min(len(hands), MAX_HANDS)
+            for i, hand in enumerate(hands[:MAX_HANDS]):
+                landmarks.array[slot, i] = hand["lmList"]
+                meta.array[slot, 1 + i] = HAND_TYPES.index(hand["type"])
+
+            result_q.put((frame_id, slot))
+    finally:
+        frames.close()
+        landmarks.close()
+        meta.close()
+
+
+class DetectorPool:
+    """Frame-parallel hand detection with results returned in capture order"""
+
+    def __init__(self, workers=2, max_in_flight=4, detector_kwargs=None, timeout=30.0):
+        self.workers = workers
+        self.max_in_flight = max(max_in_flight, workers)
+        self.timeout = timeout  # Seconds to wait for a finished frame (includes model loading)
+        self.detector_kwargs = detector_kwargs or dict(
+            staticMode=False, maxHands=MAX_HANDS, modelComplexity=1,
+            detectionCon=0.5, minTrackCon=0.5)
+
+        # Shared memory and processes are created on the first frame (its size is needed)
+        self.ctx = mp.get_context("spawn")
+        self.frames = None
+        self.processes = []
+
+        self.next_id = 0
+        self.in_flight = {}  # frame_id -> (img, submit time)
+        self.reorder = ReorderBuffer()
+        self.ready = []
+
+        # Statistics
+        self.completed = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def _start(self, shape):
+        """Allocate the frame slots and start the worker processes"""
+        slots = self.max_in_flight
+        self.frames = SharedArray((slots,) + shape, np.uint8)
+        self.landmarks = SharedArray((slots, MAX_HANDS, 21, 3), np.float32)
+        self.meta = SharedArray((slots, 1 + MAX_HANDS), np.int32)
+        self.free_slots = list(range(slots))
+
+        self.task_qs = [self.ctx.Queue() for _ in range(self.workers)]
+        self.result_q = self.ctx.Queue()
+        for task_q in self.task_qs:
+            process = self.ctx.Process(target=detector_worker, daemon=True,
+                                       args=(self.frames.spec(), self.landmarks.spec(),
+                                             self.meta.spec(), task_q, self.result_q,
+                                             self.detector_kwargs))
+            process.start()
+            self.processes.append(process)
+
+    def submit(self, img):
+        """Send a frame to the next worker (waits while max_in_flight frames are busy)"""
+        if self.frames is None:
+            self._start(img.shape)
+
+        while not self.free_slots:
+            self._wait()
+
+        slot = self.free_slots.pop()
+        self.frames.array[slot][:] = img
+
+        frame_id = self.next_id
+        self.next_id += 1
+        self.in_flight[frame_id] = (img, perf_counter())
+        self.task_qs[frame_id % self.workers].put((frame_id, slot))
+        return frame_id
+
+    def _receive(self, block):
+        """Collect one finished frame from the workers, returns False if none was ready"""
+        try:
+            if block:
+                frame_id, slot = self.result_q.get(timeout=2.0)
+            else:
+                frame_id, slot = self.result_q.get_nowait()
+        except queue.Empty:
+            if block:
+                self._check_workers()
+            return False
+
+        # Copy the landmarks out so the slot can be reused straight away
+        hands = []
+        for i in range(self.meta.array[slot, 0]):
+            lmList = self.landmarks.array[slot, i].astype(int).tolist()
+            hands.append(build_hand(lmList, HAND_TYPES[self.meta.array[slot, 1 + i]]))
+        self.free_slots.append(slot)
+
+        img, submitted = self.in_flight.pop(frame_id)
+        for ready_id, (ready_img, ready_hands, ready_submitted) in self.reorder.push(
+                frame_id, (img, hands, submitted)):
+            latency = perf_counter() - ready_submitted
+            self.completed += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.ready.append((ready_id, ready_img, ready_hands))
+        return True
+
+    def _check_workers(self):
+        """Raise if a worker process has exited"""
+        for index, process in enumerate(self.processes):
+            if not process.is_alive():
+                raise RuntimeError(f"detector worker {index} exited (exit code {process.exitcode})")
+
+    def _wait(self):
+        """Block until one more frame is finished"""
+        start = perf_counter()
+        while not self._receive(block=True):
+            if perf_counter() - start > self.timeout:
+                raise TimeoutError(f"no frame from the detector workers in {self.timeout:.0f}s")
+
+    def results(self, block=False):
+        """Return the finished (frame_id, img, hands) results in capture order"""
+        while self._receive(block=False):
+            pass
+        if block and not self.ready and self.in_flight:
+            self._receive(block=True)
+        ready, self.ready = self.ready, []
+        return ready
+
+    def drain(self):
+        """Wait for every frame still in flight and return the results"""
+        ready = []
+        while self.in_flight:
+            self._wait()
+            ready.extend(self.results())
+        return ready + self.results()
+
+    def fingersUp(self, myHand):
+        """Count fingers up (same rules as HandDetector.fingersUp)"""
+        return fingers_up(myHand)
+
+    def stats(self):
+        """Return pool statistics as a dictionary"""
+        mean = self.total_latency / self.completed if self.completed else 0.0
+        return {
+            "workers": self.workers,
+            "completed": self.completed,
+            "in_flight": len(self.in_flight),
+            "mean_latency_ms": mean * 1000,
+            "max_latency_ms": self.max_latency * 1000,
+        }
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        for task_q in getattr(self, "task_qs", []):
+            task_q.put(None)
+        for process in self.processes:
+            process.join(timeout=3)
+            if process.is_alive():
+                process.terminate()
+        if self.frames is not None:
+            self.frames.close()
+            self.landmarks.close()
+            self.meta.close()
+            self.frames = None
+
+
+def main():
+    import cv2
+    from benchmark_inference_scale import load_frames
+
+    parser = argparse.ArgumentParser(description="Benchmark the hand detector worker pool")
+    parser.add_argument("--source", default="0", help="camera index or video file (default: 0)")
+    parser.add_argument("--frames", type=int, default=200, help="number of frames to test")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("--max-in-flight", type=int, default=0,
+                        help="frames in flight (default: 2 per worker)")
+    args = parser.parse_args()
+
+    print(f"Loading {args.frames} frames from {args.source}...")
+    frames = load_frames(args.source, args.frames)
+    if not frames:
+        print("Failed to read from camera")
+        return
+    print(f"Loaded {len(frames)} frames | OpenCV {cv2.__version__} | {mp.cpu_count()} CPU cores")
+
+    print(f"\n{'Workers':>7} {'FPS':>7} {'Speedup':>8} {'Mean latency':>13} {'Max latency':>12}")
+    base_fps = None
+    for workers in args.workers:
+        pool = DetectorPool(workers=workers, max_in_flight=args.max_in_flight or 2 * workers)
+        try:
+            # Warm up every worker (model loading is not part of the measurement)
+            for img in frames[:workers * 2]:
+                pool.submit(img)
+            pool.drain()
+            pool.completed, pool.total_latency, pool.max_latency = 0, 0.0, 0.0
+
+            start = perf_counter()
+            for img in frames:
+                pool.submit(img)
+                pool.results()
+            pool.drain()
+            fps = len(frames) / (perf_counter() - start)
+        finally:
+            pool.close()
+
+        base_fps = base_fps or fps
+        stats = pool.stats()
+        print(f"{workers:>7} {fps:>7.1f} {fps / base_fps:>7.2f}x "
+              f"{stats['mean_latency_ms']:>10.1f} ms {stats['max_latency_ms']:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Fast Start
+- The slow parts of starting a hand tracking script are importing
+  cvzone/MediaPipe, building the HandDetector, opening the camera and
+  setting up GPIO - done one after another they add up to several seconds
+- run_parallel() does them at the same time on worker threads
+  (camera and GPIO setup mostly wait on the kernel, model loading on MediaPipe)
+- cvzone is only imported inside load_hand_detector(), on a worker thread
+- warm_up() runs the detector once on a blank frame, so the first real
+  frame does not pay for MediaPipe's lazy initialisation
+- StartupProfiler prints what each step cost, measured from process start,
+  up to the first GPIO actuation
+
+Usage:
+    startup = StartupProfiler()
+    parts = startup.run_parallel({"camera": lambda: open_camera(0), "detector": load_hand_detector})
+    warm_up(parts["detector"], startup)
+    ...
+    startup.mark("first actuation")
+    print(startup.report())
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from time import perf_counter
+
+
+def process_age():
+    """Seconds since this process started (Linux), or None if unknown"""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (after the command name in brackets) is the start time in clock ticks since boot
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupProfiler:
+    """Time the steps of starting up, including steps run in parallel"""
+
+    def __init__(self):
+        self.t0 = perf_counter()
+        # Time already spent before the profiler was created (interpreter start, early imports)
+        self.offset = process_age() or 0.0
+        self.last_mark = self.t0
+        self.steps = []  # (name, start, duration, parallel)
+        self.lock = threading.Lock()
+
+    def _add(self, name, start, end, parallel=False):
+        with self.lock:
+            self.steps.append((name, start - self.t0 + self.offset, end - start, parallel))
+
+    def mark(self, name):
+        """Record a step that ran from the previous mark until now"""
+        now = perf_counter()
+        self._add(name, self.last_mark, now)
+        self.last_mark = now
+
+    @contextmanager
+    def step(self, name, parallel=False):
+        """Time the code inside a with block"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, start, perf_counter(), parallel)
+            if not parallel:
+                self.last_mark = perf_counter()
+
+    def run_parallel(self, tasks):
+        """Run {name: function} at the same time, returns {name: result} (errors are re-raised)"""
+        def timed(name, fn):
+            with self.step(name, parallel=True):
+                return fn()
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            futures = {name: pool.submit(timed, name, fn) for name, fn in tasks.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        self._add("parallel init", start, perf_counter())
+        self.last_mark = perf_counter()
+        return results
+
+    def elapsed(self):
+        """Seconds since process start"""
+        return perf_counter() - self.t0 + self.offset
+
+    def report(self):
+        """Return the startup breakdown as a printable string"""
+        lines = [f"  {'step':<22} {'start':>8} {'took':>8}"]
+        with self.lock:
+            steps = sorted(self.steps, key=lambda s: s[1])
+        if self.offset:
+            lines.append(f"  {'before profiler':<22} {0:>6.0f}ms {self.offset * 1000:>6.0f}ms")
+        for name, start, duration, parallel in steps:
+            label = f"  {name}" if parallel else name
+            lines.append(f"  {label:<22} {start * 1000:>6.0f}ms {duration * 1000:>6.0f}ms")
+        return f"Startup breakdown ({self.elapsed() * 1000:.0f}ms since process start)\n" + "\n".join(lines)
+
+
+# HandDetector settings used by the Lesson 6 scripts
+DETECTOR_DEFAULTS = dict(staticMode=False, maxHands=2, modelComplexity=1, detectionCon=0.5, minTrackCon=0.5)
+
+
+def load_hand_detector(**kwargs):
+    """Import cvzone and build a HandDetector (slow - meant for a worker thread)"""
+    from cvzone.HandTrackingModule import HandDetector
+
+    return HandDetector(**dict(DETECTOR_DEFAULTS, **kwargs))
+
+
+def close_hand_detector(detector):
+    """Free the MediaPipe graph of a HandDetector that is no longer used"""
+    close = getattr(getattr(detector, "hands", None), "close", None)
+    if close is not None:
+        close()
+
+
+def warm_up(detector, profiler=None, shape=(480, 640, 3)):
+    """Run one detection on a blank frame so the first real frame is not slow"""
+    import numpy as np
+
+    blank = np.zeros(shape, dtype=np.uint8)
+    if profiler is None:
+        detector.findHands(blank, draw=False)
+        return
+    with profiler.step("detector warm-up"):
+        detector.findHands(blank, draw=False)
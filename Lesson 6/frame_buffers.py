@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Reused Frame Buffers
+- Every cv2.resize / cv2.cvtColor call normally returns a brand new image,
+  which on the Pi means a few hundred KB of fresh memory per step per frame
+- FramePreprocessor keeps one buffer per step and writes into it (dst=...),
+  so resize + BGR-to-RGB for the hand model reuse the same memory every frame
+- Counts buffer allocations so allocations per frame can be checked
+  (they should drop to 0 once the first frame has set up the buffers)
+"""
+
+import cv2
+import numpy as np
+
+
+class FramePreprocessor:
+    """Resize and colour-convert frames into reused buffers"""
+
+    def __init__(self):
+        self.buffers = {}  # step name -> preallocated image
+
+        # Statistics
+        self.frames = 0
+        self.allocations = 0
+
+    def buffer(self, name, shape, dtype=np.uint8):
+        """Return the buffer for a step, allocating it only when the size changes"""
+        buf = self.buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self.buffers[name] = buf
+            self.allocations += 1
+        return buf
+
+    def to_rgb(self, img, scale=1.0):
+        """Return an RGB copy of img at the given scale (the returned image is reused next frame)"""
+        self.frames += 1
+        height, width = img.shape[:2]
+
+        if scale < 1.0:
+            # Shrink first, so the colour conversion touches fewer pixels
+            size = (max(1, int(width * scale)), max(1, int(height * scale)))
+            small = self.buffer("small", (size[1], size[0], 3))
+            img = cv2.resize(img, size, dst=small, interpolation=cv2.INTER_AREA)
+
+        rgb = self.buffer("rgb", img.shape)
+        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=rgb)
+
+    def stats(self):
+        """Return allocation statistics as a dictionary"""
+        return {
+            "frames": self.frames,
+            "allocations": self.allocations,
+            "per_frame": self.allocations / self.frames if self.frames else 0.0,
+        }
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Threaded Frame Grabber
+- Reads frames from the camera on its own thread
+- Keeps only the newest frames in a small ring buffer
+- The main loop always gets the newest frame, older ones are dropped
+- Reports dropped frames and frame age so camera-to-GPIO latency stays visible
+- read() only fails once the camera has failed or the grabber is stopped; when
+  no new frame arrives in time (a camera stall, a slow first frame) it returns
+  (True, None) so the caller can carry on and try again
+- threaded=False reads every frame in order (for replaying video files)
+- reuse_buffers=True reads into a few preallocated frames (cap.read(image=buf))
+  instead of a new image per frame; a frame handed out stays valid until the
+  next read(), so only use it when nothing keeps frames longer than that
+"""
+
+import threading
+from collections import deque
+from time import monotonic
+
+
+class FrameGrabber:
+    """Grab camera frames on a background thread - latest frame wins"""
+
+    def __init__(self, cap, buffer_size=2, threaded=True, reuse_buffers=False):
+        self.cap = cap
+        self.threaded = threaded
+        self.reuse_buffers = reuse_buffers
+        self.buffer = deque(maxlen=buffer_size)
+        self.free = []        # Frames nobody is using, ready to be read into
+        self.held = None      # Frame the main loop got from the last read()
+        self.cond = threading.Condition()
+        self.thread = None
+        self.running = False
+        self.failed = False
+
+        # Statistics
+        self.captured = 0      # Frames read from the camera
+        self.delivered = 0     # Frames handed to the main loop
+        self.dropped = 0       # Frames that were never handed out
+        self.last_age = 0.0    # Age (seconds) of the last frame handed out
+        self.last_timestamp = 0.0  # Capture time of the last frame handed out
+        self.allocations = 0   # Frames the camera had to allocate (not read into a reused buffer)
+
+    def start(self):
+        """Start the capture thread"""
+        self.running = True
+        if not self.threaded:
+            return self
+        self.thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.thread.start()
+        return self
+
+    def _capture_loop(self):
+        """Keep reading frames until stopped or the camera fails"""
+        while self.running:
+            with self.cond:
+                buf = self.free.pop() if self.free else None
+            success, img = self._read_into(buf)
+            timestamp = monotonic()
+
+            with self.cond:
+                if not success:
+                    self.failed = True
+                    self.cond.notify_all()
+                    break
+
+                self.captured += 1
+                # A full buffer means the oldest unread frame gets pushed out
+                if len(self.buffer) == self.buffer.maxlen:
+                    self.dropped += 1
+                    self._release(self.buffer[0][1])
+                self.buffer.append((timestamp, img))
+                self.cond.notify_all()
+
+    def read(self, timeout=1.0):
+        """Return (success, img) for the newest frame, like cap.read()
+        ((True, None) when no new frame arrived within timeout seconds)"""
+        if not self.threaded:
+            return self._read_direct()
+
+        with self.cond:
+            self.cond.wait_for(lambda: self.buffer or self.failed or not self.running,
+                               timeout)
+            if not self.buffer:
+                # Failed or stopped is final, a timeout only means no frame yet
+                return (not self.failed and self.running), None
+
+            timestamp, img = self.buffer.pop()
+            # Anything still in the buffer is older than this frame - skip it
+            self.dropped += len(self.buffer)
+            for _, old in self.buffer:
+                self._release(old)
+            self.buffer.clear()
+            self.delivered += 1
+
+            # The main loop is done with the previous frame, so it can be read into again
+            self._release(self.held)
+            self.held = img
+
+        self.last_timestamp = timestamp
+        self.last_age = monotonic() - timestamp
+        return True, img
+
+    def _read_direct(self):
+        """Read the next frame on the calling thread - nothing is ever dropped"""
+        success, img = self._read_into(self.held)
+        self.last_timestamp = monotonic()
+        self.last_age = 0.0
+        if success:
+            self.held = img
+            self.captured += 1
+            self.delivered += 1
+        return success, img
+
+    def _read_into(self, buf):
+        """cap.read() into buf when reusing buffers, counting every new frame allocated"""
+        if not self.reuse_buffers:
+            buf = None
+        if buf is None:
+            success, img = self.cap.read()
+        else:
+            success, img = self.cap.read(image=buf)
+        if success and img is not buf:
+            self.allocations += 1
+        return success, img
+
+    def _release(self, img):
+        """Give a frame back for the capture thread to read into (lock held)"""
+        if self.reuse_buffers and img is not None:
+            self.free.append(img)
+
+    def stats(self):
+        """Return capture statistics as a dictionary"""
+        with self.cond:
+            return {
+                "captured": self.captured,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "allocations": self.allocations,
+                "age_ms": self.last_age * 1000,
+            }
+
+    def stop(self):
+        """Stop the capture thread (the camera itself is not released)"""
+        self.running = False
+        with self.cond:
+            self.cond.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+
+
+if __name__ == "__main__":
+    # Quick test: show how many frames get dropped while the main loop is slow
+    from time import sleep
+    from camera_profile import open_camera
+
+    cap = open_camera(0)
+    grabber = FrameGrabber(cap).start()
+
+    try:
+        for _ in range(50):
+            success, img = grabber.read()
+            if not success:
+                print("Failed to read from camera")
+                break
+            if img is None:
+                print("No frame yet")
+                continue
+            sleep(0.1)  # Pretend inference takes 100 ms
+            stats = grabber.stats()
+            print(f"Age: {stats['age_ms']:.1f} ms | Dropped: {stats['dropped']}")
+    finally:
+        grabber.stop()
+        cap.release()
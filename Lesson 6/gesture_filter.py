@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Gesture Filter
+- Sits between finger counting and the motor/LEDs
+- Majority vote over the last few frames hides single misdetected frames
+- Minimum dwell time stops the output from switching back and forth quickly
+- When the hand disappears the last value is held for a short timeout,
+  so one frame without a hand does not stop and restart the motor
+"""
+
+from collections import Counter, deque
+from time import monotonic
+
+
+class GestureFilter:
+    """Turn noisy per-frame finger counts into stable commands"""
+
+    def __init__(self, window=5, min_dwell=0.25, hold_timeout=0.5, default=0):
+        self.votes = deque(maxlen=window)  # Recent finger counts
+        self.min_dwell = min_dwell          # Seconds an output must last before it can change
+        self.hold_timeout = hold_timeout    # Seconds to keep the last value without a hand
+        self.default = default              # Output once the hand is gone (0 = stop)
+
+        self.output = default
+        self.last_change = None
+        self.last_seen = None
+        self.last_raw = default
+
+        # Statistics
+        self.raw_changes = 0   # Changes in the unfiltered input
+        self.transitions = 0   # Changes in the filtered output
+
+    def update(self, value, now=None):
+        """Feed this frame's finger count (None when no hand) and return the stable value"""
+        if now is None:
+            now = monotonic()
+
+        raw = self.default if value is None else value
+        if raw != self.last_raw:
+            self.raw_changes += 1
+            self.last_raw = raw
+
+        if value is None:
+            # No hand - hold the last value for a while, then fall back to the default
+            if self.last_seen is not None and now - self.last_seen < self.hold_timeout:
+                return self.output
+            self.votes.clear()
+            self._change(self.default, now)
+            return self.output
+
+        self.last_seen = now
+        self.votes.append(value)
+
+        # The new value must win a majority of the window and the old one must have dwelled
+        winner, count = Counter(self.votes).most_common(1)[0]
+        if winner != self.output and count > len(self.votes) // 2:
+            if self.last_change is None or now - self.last_change >= self.min_dwell:
+                self._change(winner, now)
+
+        return self.output
+
+    def _change(self, value, now):
+        """Switch the output to a new value"""
+        if value != self.output:
+            self.output = value
+            self.last_change = now
+            self.transitions += 1
+
+    def stats(self):
+        """Return filter statistics as a dictionary"""
+        return {"raw_changes": self.raw_changes, "transitions": self.transitions}
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+GPIO Output Cache
+- Sits between the gesture logic and gpiozero output devices
+- Remembers the last value written to each device and skips repeats,
+  so a steady gesture does not rewrite the same pins every frame
+- Groups of pins are updated together, switching things off before
+  switching things on (no moment where two LEDs are lit)
+- Counts real and suppressed writes
+"""
+
+
+class OutputStateCache:
+    """Only write GPIO outputs whose value actually changed"""
+
+    def __init__(self):
+        self.state = {}  # device -> last value written
+
+        # Statistics
+        self.writes = 0
+        self.suppressed = 0
+
+    def set(self, device, value):
+        """Write value to a device (LED, PWMOutputDevice, Motor...) if it changed"""
+        return self.set_group([(device, value)]) > 0
+
+    def set_group(self, updates):
+        """Apply several (device, value) updates together, returns how many were written"""
+        changed = []
+        for device, value in updates:
+            if device in self.state and self.state[device] == value:
+                self.suppressed += 1
+            else:
+                changed.append((device, value))
+
+        # Break before make - anything going down is written before anything going up
+        changed.sort(key=lambda item: item[1] >= self.state.get(item[0], 0))
+
+        for device, value in changed:
+            device.value = value
+            self.state[device] = value
+            self.writes += 1
+        return len(changed)
+
+    def forget(self, device=None):
+        """Forget the cached value (after a device was written directly), or all values"""
+        if device is None:
+            self.state.clear()
+        else:
+            self.state.pop(device, None)
+
+    def stats(self):
+        """Return write statistics as a dictionary"""
+        return {"writes": self.writes, "suppressed": self.suppressed}
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Hand Identity Tracker
+- cvzone returns hands in whatever order MediaPipe found them, so hands[0]
+  can swap between frames when two hands are in view
+- This gives every hand a stable slot (0, 1, ...) across frames: each new frame's
+  hands are matched to the known hands by centre distance, with a penalty
+  when the Left/Right type does not match
+- New hands take a free slot (Right hand prefers slot 0, Left hand slot 1), and a
+  hand keeps its slot for a few missed frames so a single dropout does not swap it
+- A slot kept for a missing hand is given up straight away when a new hand needs it
+  and no slot is free (with one slot, a hand showing up elsewhere takes over at once)
+- Works on the hand dictionaries cvzone already returns - no extra inference
+"""
+
+import math
+
+# Preferred slot for a new hand of each type
+PREFERRED_SLOT = {"Right": 0, "Left": 1}
+
+
+class HandIdTracker:
+    """Assign each detected hand a slot that stays the same from frame to frame"""
+
+    def __init__(self, max_hands=2, max_distance=200, type_penalty=100, max_missing=5):
+        self.max_hands = max_hands        # Number of slots (actuator channels)
+        self.max_distance = max_distance  # Pixels a hand may move between frames
+        self.type_penalty = type_penalty  # Extra distance when Left/Right does not match
+        self.max_missing = max_missing    # Frames a slot is kept after its hand is lost
+
+        self.tracks = {}  # slot -> {"type", "center", "missing"}
+
+        # Statistics
+        self.new_hands = 0
+        self.lost_hands = 0
+
+    def update(self, hands):
+        """Return {slot: hand} for this frame's hands"""
+        # Every (slot, hand) pairing that is close enough, cheapest first
+        pairs = []
+        for slot, track in self.tracks.items():
+            for index, hand in enumerate(hands):
+                cost = math.dist(track["center"], hand["center"])
+                if hand["type"] != track["type"]:
+                    cost += self.type_penalty
+                if cost <= self.max_distance:
+                    pairs.append((cost, slot, index))
+        pairs.sort()
+
+        assigned = {}
+        used = set()
+        for cost, slot, index in pairs:
+            if slot not in assigned and index not in used:
+                assigned[slot] = hands[index]
+                used.add(index)
+
+        # Unmatched hands take a free slot, or else the slot kept for a missing hand
+        for index, hand in enumerate(hands):
+            if index in used:
+                continue
+            slot = self._free_slot(hand["type"], assigned)
+            if slot is None:
+                slot = self._missing_slot(hand["type"], assigned)
+                if slot is None:
+                    continue
+                self.lost_hands += 1
+            assigned[slot] = hand
+            self.new_hands += 1
+
+        # Refresh matched slots and age the others
+        for slot, hand in assigned.items():
+            self.tracks[slot] = {"type": hand["type"], "center": hand["center"], "missing": 0}
+        for slot in list(self.tracks):
+            if slot not in assigned:
+                self.tracks[slot]["missing"] += 1
+                if self.tracks[slot]["missing"] > self.max_missing:
+                    del self.tracks[slot]
+                    self.lost_hands += 1
+
+        return assigned
+
+    def _free_slot(self, hand_type, assigned):
+        """Preferred slot for the hand type if free, otherwise the lowest free slot"""
+        taken = set(self.tracks) | set(assigned)
+        preferred = PREFERRED_SLOT.get(hand_type)
+        if preferred is not None and preferred < self.max_hands and preferred not in taken:
+            return preferred
+        for slot in range(self.max_hands):
+            if slot not in taken:
+                return slot
+        return None
+
+    def _missing_slot(self, hand_type, assigned):
+        """Slot of a tracked hand not seen this frame (same type first, then the longest missing)"""
+        missing = [slot for slot in self.tracks if slot not in assigned]
+        if not missing:
+            return None
+        return min(missing, key=lambda slot: (self.tracks[slot]["type"] != hand_type,
+                                              -self.tracks[slot]["missing"], slot))
+
+    def stats(self):
+        """Return tracker statistics as a dictionary"""
+        return {"tracked": len(self.tracks), "new_hands": self.new_hands, "lost_hands": self.lost_hands}
@@ -1,17 +1,36 @@
-from cvzone.HandTrackingModule import HandDetector
 import cv2
-from gpiozero import LED
 import cvzone
+from async_log import AsyncLogger
+from camera_profile import open_camera
+from fast_start import StartupProfiler, warm_up
+from vision_server import connect_hand_detector
 
-# Initialize LED on GPIO pin 17 (you can change this to any available GPIO pin)
-led = LED(17)
+# Time every startup step up to the first LED update
+startup = StartupProfiler()
 
-# Initialize the webcam to capture video
-# Use 0 for the default camera on Raspberry Pi
-cap = cv2.VideoCapture(0)
+def init_led():
+    """Initialize LED on GPIO pin 17 (you can change this to any available GPIO pin)"""
+    from gpiozero import LED
+    return LED(17)
 
-# Initialize the HandDetector class with the given parameters
-detector = HandDetector(staticMode=False, maxHands=2, modelComplexity=1, detectionCon=0.5, minTrackCon=0.5)
+# Open the webcam, set up the LED and load the hand model at the same time
+# (the webcam uses the low-latency camera profile - 0 is the default camera on Raspberry Pi,
+# and the hand model attaches to vision_server.py in milliseconds if it is running)
+parts = startup.run_parallel({
+    "camera": lambda: open_camera(0),
+    "gpio": init_led,
+    "hand model": lambda: connect_hand_detector(staticMode=False, maxHands=2, modelComplexity=1,
+                                                detectionCon=0.5, minTrackCon=0.5),
+})
+cap = parts["camera"]
+led = parts["gpio"]
+detector = parts["hand model"]
+
+# Run the model once on a blank frame so the first real frame is not slow
+warm_up(detector, startup)
+
+# Status lines go through a background writer (at most 5 lines per second, repeats merged)
+logger = AsyncLogger(max_rate=5)
 
 # LED status flag for display
 led_status = False
@@ -62,14 +81,17 @@ try:
             # Visual indicator circle
             cv2.circle(img, (300, 75), 20, led_color, cv2.FILLED)
             
-            # Print to console
-            print(f"Fingers: {finger_count} | LED: {'ON' if led_status else 'OFF'}")
-            
-            # Check if a second hand is detected
+            # Print to console (formatted and written by the logger thread)
             if len(hands) == 2:
+                # A second hand is detected
                 hand2 = hands[1]
                 fingers2 = detector.fingersUp(hand2)
-                print(f"Hand 2: {fingers2.count(1)} fingers")
+                logger.log("Fingers: {fingers} | LED: {led} | Hand 2: {fingers2} fingers",
+                           fingers=finger_count, led='ON' if led_status else 'OFF',
+                           fingers2=fingers2.count(1))
+            else:
+                logger.log("Fingers: {fingers} | LED: {led}",
+                           fingers=finger_count, led='ON' if led_status else 'OFF')
         else:
             # No hands detected - turn off LED
             led.off()
@@ -83,6 +105,12 @@ try:
                              scale=2, thickness=2,
                              colorT=(255, 255, 255), colorR=(0, 0, 255))
         
+        # Print the startup breakdown once the LED has been set for the first time
+        if startup is not None:
+            startup.mark("first actuation")
+            print(startup.report())
+            startup = None
+        
         # Display the image in a window
         cv2.imshow("Hand Tracking - LED Control", img)
         
@@ -96,6 +124,7 @@ except KeyboardInterrupt:
 
 finally:
     # Clean up
+    logger.close()
     led.off()
     led.close()
     cap.release()
@@ -1,208 +1,696 @@
-from cvzone.HandTrackingModule import HandDetector
 import cv2
-from gpiozero import Motor, PWMOutputDevice
-import cvzone
-from time import sleep
-
-# L298N Motor Driver GPIO Pin Configuration
-# Motor A connections
-MOTOR_ENA = 18  # Enable A (PWM pin for speed control)
-MOTOR_IN1 = 23  # Input 1 for Motor A
-MOTOR_IN2 = 24  # Input 2 for Motor A
-
-# Initialize motor with L298N driver
-# Using PWMOutputDevice for speed control on ENA pin
-pwm = PWMOutputDevice(MOTOR_ENA)
-motor = Motor(forward=MOTOR_IN1, backward=MOTOR_IN2)
-
-# Speed mapping for finger counts
-speed_map = {
-    0: 0,     # No fingers - motor stopped
-    1: 0.5,   # 1 finger - 50% speed
-    2: 0.6,   # 2 fingers - 60% speed
-    3: 0.7,   # 3 fingers - 70% speed
-    4: 0.8,   # 4 fingers - 80% speed
-    5: 1.0    # 5 fingers - 100% speed
-}
-
-# Initialize the webcam to capture video
-cap = cv2.VideoCapture(0)
-
-# Initialize the HandDetector class
-detector = HandDetector(staticMode=False, maxHands=2, modelComplexity=1, detectionCon=0.5, minTrackCon=0.5)
-
-# Motor state variables
-current_speed = 0
-motor_running = False
-
-def set_motor_speed(finger_count):
-    """Set motor speed based on finger count"""
-    global current_speed, motor_running
-    
-    # Get speed from mapping
-    target_speed = speed_map.get(finger_count, 0)
-    
-    if target_speed > 0:
-        # Set PWM duty cycle for speed control
-        pwm.value = target_speed
-        # Start motor forward
-        motor.forward()
-        motor_running = True
-    else:
-        # Stop motor
-        motor.stop()
-        pwm.value = 0
-        motor_running = False
-    
-    current_speed = target_speed
-    return target_speed
-
-def draw_motor_status(img, finger_count, speed):
-    """Draw motor status and speed indicator on the image"""
-    # Draw speed gauge background
-    gauge_x, gauge_y = 450, 100
-    gauge_width, gauge_height = 150, 30
-    
-    # Background rectangle
-    cv2.rectangle(img, (gauge_x, gauge_y), (gauge_x + gauge_width, gauge_y + gauge_height), 
-                  (200, 200, 200), -1)
-    
-    # Speed fill (colored based on speed)
-    if speed > 0:
-        fill_width = int(gauge_width * speed)
-        # Color gradient from green to red based on speed
-        if speed <= 0.6:
-            color = (0, 255, 0)  # Green for low speed
-        elif speed <= 0.8:
-            color = (0, 165, 255)  # Orange for medium speed
-        else:
-            color = (0, 0, 255)  # Red for high speed
+import argparse
+import signal
+import threading
+from time import sleep, monotonic
+from frame_grabber import FrameGrabber
+from tracking_hand_detector import TrackingHandDetector
+from roi_hand_detector import RoiHandDetector
+from scaled_hand_detector import ScaledHandDetector
+from stage_timer import StageTimer
+from hud_compositor import HudCompositor
+from detector_pool import DetectorPool
+from hand_utils import draw_hand
+from gpio_output_cache import OutputStateCache
+from gesture_filter import GestureFilter
+from landmark_array import HandLandmarks
+from async_log import AsyncLogger
+from latency_probe import LatencyProbe
+from quality_governor import QualityGovernor, matching_level
+from motion_gate import MotionGate
+from camera_profile import open_camera
+from motor_controller import MotorController
+from motor_watchdog import MotorWatchdog
+from hand_identity import HandIdTracker
+from fast_start import StartupProfiler, close_hand_detector, load_hand_detector, warm_up
+from vision_server import VisionClient, connect_hand_detector
+
+def main():
+    """Drive the motor from hand gestures until 'q', Ctrl+C or SIGTERM"""
+    # Time every startup step up to the first motor actuation
+    # (cvzone/MediaPipe and gpiozero are imported later, in parallel with opening the camera)
+    startup = StartupProfiler()
+
+    # Command line options
+    parser = argparse.ArgumentParser(description="Hand tracking DC motor control")
+    parser.add_argument("--headless", action="store_true",
+                        help="no window and no overlays - stop with Ctrl+C or SIGTERM")
+    parser.add_argument("--timing-interval", type=float, default=10.0,
+                        help="seconds between stage timing reports (default: 10)")
+    parser.add_argument("--source", default="0",
+                        help="camera index or a recorded video file (default: 0)")
+    parser.add_argument("--record", metavar="CSV",
+                        help="write finger count, speed, pin states and timings for every frame")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="hand detector processes working on alternate frames (default: 1)")
+    parser.add_argument("--max-in-flight", type=int, default=4,
+                        help="most frames waiting on the detector workers (default: 4)")
+    parser.add_argument("--target-fps", type=float, default=0,
+                        help="adapt model complexity, inference scale and detection interval "
+                             "to hold this frame rate (default: off)")
+    parser.add_argument("--motion-gate", action="store_true",
+                        help="skip hand detection while the scene is static (idle when nobody is there)")
+    parser.add_argument("--pir-pin", type=int,
+                        help="GPIO pin of a PIR motion sensor that also wakes the motion gate")
+    parser.add_argument("--max-latency-ms", type=float, default=150,
+                        help="latency limit for the quality governor (default: 150)")
+    parser.add_argument("--accel", type=float, default=2.0,
+                        help="motor speed-up limit in full speed per second, 0 = no limit (default: 2)")
+    parser.add_argument("--decel", type=float, default=4.0,
+                        help="motor slow-down limit in full speed per second, 0 = no limit (default: 4)")
+    parser.add_argument("--hw-pwm", action="store_true",
+                        help="drive ENA from the hardware PWM channel (needs the pwm-2chan overlay)")
+    parser.add_argument("--pwm-chip", type=int,
+                        help="pwmchip number for --hw-pwm (default: found from the RP1 PWM0 device link)")
+    parser.add_argument("--two-hands", action="store_true",
+                        help="right hand drives motor A, left hand drives motor B (L298N channel B)")
+    parser.add_argument("--landmarks", metavar="FILE",
+                        help="log every frame's landmarks to a compact binary file (see landmark_log.py)")
+    parser.add_argument("--watchdog-ms", type=float, default=250,
+                        help="stop the motor when no frame finishes within this many ms (default: 250)")
+    args = parser.parse_args()
+
+    # L298N Motor Driver GPIO Pin Configuration
+    # Motor A connections
+    MOTOR_ENA = 18  # Enable A (PWM pin for speed control)
+    MOTOR_IN1 = 23  # Input 1 for Motor A
+    MOTOR_IN2 = 24  # Input 2 for Motor A
+
+    # Motor B connections (only used with --two-hands)
+    MOTOR_ENB = 19  # Enable B (PWM pin for speed control, the second hardware PWM pin)
+    MOTOR_IN3 = 5   # Input 3 for Motor B
+    MOTOR_IN4 = 6   # Input 4 for Motor B
+
+    def make_pwm(pin):
+        """Create the PWM output for an enable pin"""
+        # Using PWMOutputDevice for speed control on the enable pin
+        # (with --hw-pwm the RP1 hardware PWM drives it instead - no CPU cost or jitter under load,
+        # see benchmark_pwm.py)
+        if args.hw_pwm:
+            from hardware_pwm import OVERLAY_PINS, HardwarePWM
+            if pin not in OVERLAY_PINS:
+                raise ValueError(f"--hw-pwm: GPIO {pin} is not switched to PWM by the pwm-2chan overlay "
+                                 f"(pins {OVERLAY_PINS}) - it would get no PWM at all")
+            try:
+                device = HardwarePWM(pin, frequency=1000, chip=args.pwm_chip)
+                print(f"Using hardware PWM: {device}")
+                return device
+            except (RuntimeError, ValueError, OSError) as e:
+                print(f"Hardware PWM unavailable ({e}) - using software PWM")
+        from gpiozero import PWMOutputDevice
+        return PWMOutputDevice(pin)
+
+    def init_gpio():
+        """Initialize motor with L298N driver (motor B too with --two-hands)"""
+        from gpiozero import Motor
+        pwm = make_pwm(MOTOR_ENA)
+        motor = Motor(forward=MOTOR_IN1, backward=MOTOR_IN2)
+        pwm_b = motor_b = None
+        if args.two_hands:
+            pwm_b = make_pwm(MOTOR_ENB)
+            motor_b = Motor(forward=MOTOR_IN3, backward=MOTOR_IN4)
+        return pwm, motor, pwm_b, motor_b
+
+    # Speed mapping for finger counts
+    speed_map = {
+        0: 0,     # No fingers - motor stopped
+        1: 0.5,   # 1 finger - 50% speed
+        2: 0.6,   # 2 fingers - 60% speed
+        3: 0.7,   # 3 fingers - 70% speed
+        4: 0.8,   # 4 fingers - 80% speed
+        5: 1.0    # 5 fingers - 100% speed
+    }
+
+    # Initialize the webcam with the low-latency camera profile (or open a recorded video to replay)
+    source = int(args.source) if args.source.isdigit() else args.source
+    replaying = not isinstance(source, int)
+
+    # Open the camera, set up the GPIO pins and load the hand model at the same time,
+    # then run the model once on a blank frame so the first real frame is not slow
+    # (with vision_server.py running, the already-warm model there is used instead of loading one)
+    model_complexity = 1
+    startup.mark("imports and setup")
+    parts = startup.run_parallel({
+        "camera": lambda: open_camera(source),
+        "gpio": init_gpio,
+        "hand model": lambda: connect_hand_detector(modelComplexity=model_complexity),
+    })
+    cap = parts["camera"]
+    pwm, motor, pwm_b, motor_b = parts["gpio"]
+    frame_shape = (int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 480, int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 640, 3)
+    warm_up(parts["hand model"], startup, shape=frame_shape)
+
+    # Read frames on a background thread so the motor always reacts to the newest frame
+    # (a replayed video is read in order instead, so every frame gets processed)
+    # Frames are read into reused buffers, except with --workers where frames wait in the pool
+    grabber = FrameGrabber(cap, buffer_size=2, threaded=not replaying, reuse_buffers=args.workers <= 1)
+
+    # Per-frame status lines go through a background writer (at most LOG_MAX_LINES_PER_S lines
+    # per second, repeated lines merged) so a slow console never stalls the vision loop
+    LOG_MAX_LINES_PER_S = 5
+    logger = AsyncLogger(max_rate=LOG_MAX_LINES_PER_S)
+
+    # Glass-to-GPIO latency: every frame's capture time is carried through detection,
+    # filtering and actuation (p50/p95/p99 printed on exit or with: kill -USR1 <pid>)
+    # (the actuate stage ends when the motor control thread writes the pins for the frame's
+    # target on its next tick - a frame superseded before that tick is not counted)
+    latency = LatencyProbe(["detect", "filter", "actuate"])
+    latency.install_signal()
+
+    # With --motion-gate, hand detection only runs while something moves (or a hand is in view)
+    gate = None
+    pir = None
+    if args.motion_gate:
+        if args.pir_pin is not None:
+            from gpiozero import MotionSensor
+            pir = MotionSensor(args.pir_pin)
+        gate = MotionGate(idle_after=2.0, pir=pir)
+
+    # Optional per-frame recording (used by replay_harness.py)
+    recorder = None
+    if args.record:
+        from replay_harness import FrameRecorder
+        recorder = FrameRecorder(args.record)
+
+    # Optional landmark log for tuning speed_map and the gesture thresholds offline
+    landmark_log = None
+    if args.landmarks:
+        from landmark_log import LandmarkRecorder
+        landmark_log = LandmarkRecorder(args.landmarks)
+
+    # Run full hand detection every N frames and track landmarks in between (1 = detect every frame)
+    DETECT_EVERY_N_FRAMES = 3
+
+    # Run hand detection on a downscaled copy of each frame (1.0 = full resolution)
+    # Overlays stay at full resolution - see benchmark_inference_scale.py to pick a value
+    INFERENCE_SCALE = 0.5
+
+    # Only search a crop around the last hand position (full-frame search when the hand is lost)
+    USE_ROI_CROP = True
+
+    # Use the HandDetector loaded at startup (a scale of 1.0 passes frames straight through)
+    scaled_detector = ScaledHandDetector(parts["hand model"], scale=INFERENCE_SCALE)
+    hand_detector = scaled_detector
+    if USE_ROI_CROP:
+        hand_detector = RoiHandDetector(hand_detector, margin=0.6)
+
+    # Wrap the detector with landmark tracking
+    detector = TrackingHandDetector(hand_detector, detect_every=DETECT_EVERY_N_FRAMES)
+
+    # With --workers, several detector processes share the frames instead
+    # (results come back in capture order, at most --max-in-flight frames behind;
+    # each worker imports this file again, which is why the script runs inside main())
+    pool = None
+    if args.workers > 1:
+        pool = DetectorPool(workers=args.workers, max_in_flight=args.max_in_flight)
+
+    # MediaPipe fixes the model at creation, so a model complexity change needs a new detector.
+    # Loading one takes seconds, so it is built and warmed up on a background thread and
+    # swapped in between frames - the vision loop (and the motor watchdog) never wait for it
+    wanted_complexity = model_complexity
+    loaded_detector = None  # (model complexity, warm detector) waiting to be swapped in
+    loader = None
+
+    def load_detector(complexity):
+        """Build and warm up a detector with another model complexity (background thread)"""
+        nonlocal loaded_detector
+        new_detector = load_hand_detector(modelComplexity=complexity)
+        warm_up(new_detector, shape=frame_shape)
+        loaded_detector = (complexity, new_detector)
+
+    def swap_detector():
+        """Swap in a detector finished by load_detector and free the old one (vision loop only)"""
+        nonlocal loaded_detector, model_complexity
+        if loaded_detector is None:
+            return
+        complexity, new_detector = loaded_detector
+        loaded_detector = None
+        if complexity != wanted_complexity:
+            # The governor changed its mind while the model was loading
+            close_hand_detector(new_detector)
+            return
+        old_detector = scaled_detector.detector
+        scaled_detector.detector = new_detector
+        model_complexity = complexity
+        close_hand_detector(old_detector)
+
+    def apply_quality(settings):
+        """Switch to the detector settings chosen by the quality governor"""
+        nonlocal wanted_complexity, loader
+        # (the model in vision_server.py is fixed, so only scale and interval change there)
+        if not isinstance(scaled_detector.detector, VisionClient):
+            wanted_complexity = settings["model_complexity"]
+            loading = loaded_detector is not None or (loader is not None and loader.is_alive())
+            if wanted_complexity != model_complexity and not loading:
+                loader = threading.Thread(target=load_detector, args=(wanted_complexity,), daemon=True)
+                loader.start()
+        scaled_detector.scale = settings["scale"]
+        detector.detect_every = settings["detect_every"]
+
+    # With --target-fps, the governor trades detection quality for frame rate and latency
+    # (starting from the level that matches the settings above)
+    governor = None
+    if args.target_fps > 0 and pool is None:
+        start_level = matching_level({"model_complexity": model_complexity, "scale": INFERENCE_SCALE,
+                                      "detect_every": DETECT_EVERY_N_FRAMES})
+        governor = QualityGovernor(apply_quality, target_fps=args.target_fps,
+                                   max_latency=args.max_latency_ms / 1000, start_level=start_level,
+                                   log=logger.event)
+
+    # Motor state variables
+    current_speed = 0
+    motor_running = False
+
+    # Every hand keeps the same slot from frame to frame (hands[0] can swap when two are in view):
+    # slot 0 drives motor A, slot 1 drives motor B with --two-hands
+    hand_ids = HandIdTracker(max_hands=2 if args.two_hands else 1)
+
+    # Smooth out misdetected frames before they reach the motor:
+    # majority vote over FILTER_WINDOW frames, a speed must last MIN_DWELL_S seconds
+    # before the next change, and the last speed is held HOLD_TIMEOUT_S seconds after the hand is lost
+    FILTER_WINDOW = 5
+    MIN_DWELL_S = 0.25
+    HOLD_TIMEOUT_S = 0.5
+    gesture_filter = GestureFilter(window=FILTER_WINDOW, min_dwell=MIN_DWELL_S, hold_timeout=HOLD_TIMEOUT_S)
+    gesture_filter_b = GestureFilter(window=FILTER_WINDOW, min_dwell=MIN_DWELL_S, hold_timeout=HOLD_TIMEOUT_S)
+
+    # Only pins whose value changes get written (the same speed frame after frame costs nothing)
+    # Each motor has its own cache: the control threads write to them at the same time
+    outputs = OutputStateCache()
+    outputs_b = OutputStateCache()
+
+    # The motor runs on its own MOTOR_RATE_HZ control thread and ramps towards the
+    # speed the hand asks for (soft start and stop, no jump from 0 to 100%)
+    MOTOR_RATE_HZ = 100
+    motor_controller = MotorController(pwm, motor, rate=MOTOR_RATE_HZ, accel=args.accel,
+                                       decel=args.decel, outputs=outputs)
+    motor_controllers = [motor_controller]
+    motor_controller_b = None
+    if args.two_hands:
+        motor_controller_b = MotorController(pwm_b, motor_b, rate=MOTOR_RATE_HZ, accel=args.accel,
+                                             decel=args.decel, outputs=outputs_b)
+        motor_controllers.append(motor_controller_b)
+
+    def halt_motors():
+        """Stop every motor straight away (called by the watchdog)"""
+        for controller in motor_controllers:
+            controller.halt()
+
+    # Dead-man watchdog: every finished frame is a heartbeat, and if the vision pipeline
+    # stalls (camera or findHands hanging) the motor is stopped within --watchdog-ms
+    # (its messages go through the logger too, like the quality governor's)
+    watchdog = MotorWatchdog(halt_motors, deadline_ms=args.watchdog_ms, log=logger.event)
+
+    def record_actuation(stamp):
+        """Close a frame's latency once the control thread has written its target to the pins"""
+        latency.mark(stamp, "actuate")
+        latency.finish(stamp)
+
+    def set_motor_speed(finger_count, stamp=None):
+        """Set motor speed based on finger count"""
+        nonlocal current_speed, motor_running
+    
+        # Get speed from mapping
+        target_speed = speed_map.get(finger_count, 0)
+    
+        # The control thread ramps the PWM duty cycle towards the new speed
+        # (and ends the frame's latency measurement when it writes the pins)
+        actuated = None if stamp is None else lambda: record_actuation(stamp)
+        motor_controller.set_target(target_speed, actuated)
+        motor_running = target_speed > 0
+    
+        current_speed = target_speed
+        return target_speed
+
+    def set_motor_b_speed(finger_count):
+        """Set motor B speed based on the second hand's finger count"""
+        target_speed = speed_map.get(finger_count, 0)
+        motor_controller_b.set_target(target_speed)
+        return target_speed
+
+    # Speed gauge position and size
+    GAUGE_X, GAUGE_Y = 450, 100
+    GAUGE_WIDTH, GAUGE_HEIGHT = 150, 30
+
+    # HUD overlays are rendered once and reused every frame
+    hud = HudCompositor(max_sprites=64)
+
+    def draw_static_hud(img):
+        """Draw the overlay elements that never change"""
+        import cvzone  # Already loaded with the hand model at startup
+    
+        # Speed gauge border
+        cv2.rectangle(img, (GAUGE_X, GAUGE_Y), (GAUGE_X + GAUGE_WIDTH, GAUGE_Y + GAUGE_HEIGHT), 
+                      (0, 0, 0), 2)
+    
+        # Instructions
+        cvzone.putTextRect(img, "L298N Motor Control | Press 'q' to quit", 
+                          (50, 470), scale=1, thickness=1,
+                          colorT=(255, 255, 255), colorR=(0, 0, 0))
+
+    hud.add_static(draw_static_hud)
+
+    def draw_motor_status(img, finger_count, speed):
+        """Draw motor status and speed indicator on the image"""
+        # Background rectangle
+        hud.rectangle(img, (GAUGE_X, GAUGE_Y), (GAUGE_X + GAUGE_WIDTH, GAUGE_Y + GAUGE_HEIGHT), 
+                      (200, 200, 200))
+    
+        # Speed fill (colored based on speed)
+        if speed > 0:
+            fill_width = int(GAUGE_WIDTH * speed)
+            # Color gradient from green to red based on speed
+            if speed <= 0.6:
+                color = (0, 255, 0)  # Green for low speed
+            elif speed <= 0.8:
+                color = (0, 165, 255)  # Orange for medium speed
+            else:
+                color = (0, 0, 255)  # Red for high speed
         
-        cv2.rectangle(img, (gauge_x, gauge_y), 
-                      (gauge_x + fill_width, gauge_y + gauge_height), 
-                      color, -1)
-    
-    # Draw border
-    cv2.rectangle(img, (gauge_x, gauge_y), (gauge_x + gauge_width, gauge_y + gauge_height), 
-                  (0, 0, 0), 2)
-    
-    # Display finger count
-    cvzone.putTextRect(img, f"Fingers: {finger_count}", (50, 50), 
-                      scale=2, thickness=3,
-                      colorT=(255, 255, 255), colorR=(255, 0, 255))
-    
-    # Display motor speed percentage
-    speed_percent = int(speed * 100)
-    speed_color = (0, 255, 0) if motor_running else (0, 0, 255)
-    cvzone.putTextRect(img, f"Motor Speed: {speed_percent}%", (50, 100), 
-                      scale=2, thickness=3,
-                      colorT=(255, 255, 255), colorR=speed_color)
-    
-    # Display motor status
-    status_text = "RUNNING" if motor_running else "STOPPED"
-    status_color = (0, 255, 0) if motor_running else (0, 0, 255)
-    cvzone.putTextRect(img, f"Status: {status_text}", (50, 150), 
-                      scale=1.5, thickness=2,
-                      colorT=(255, 255, 255), colorR=status_color)
-    
-    # Draw speed indicators for each finger count
-    y_pos = 250
-    for fingers in range(1, 6):
-        speed_val = int(speed_map[fingers] * 100)
-        indicator_color = (0, 255, 0) if finger_count == fingers else (150, 150, 150)
-        cvzone.putTextRect(img, f"{fingers} finger(s): {speed_val}%", 
-                          (50, y_pos + (fingers-1)*40), 
-                          scale=1, thickness=1,
-                          colorT=(255, 255, 255), colorR=indicator_color)
-    
-    # Safety warning
-    if speed >= 0.8:
-        cvzone.putTextRect(img, "HIGH SPEED!", (450, 50), 
+            hud.rectangle(img, (GAUGE_X, GAUGE_Y), 
+                          (GAUGE_X + fill_width, GAUGE_Y + GAUGE_HEIGHT), 
+                          color)
+    
+        # Display finger count
+        hud.put_text_rect(img, f"Fingers: {finger_count}", (50, 50), 
+                          scale=2, thickness=3,
+                          colorT=(255, 255, 255), colorR=(255, 0, 255))
+    
+        # Display motor speed percentage
+        speed_percent = int(speed * 100)
+        speed_color = (0, 255, 0) if motor_running else (0, 0, 255)
+        hud.put_text_rect(img, f"Motor Speed: {speed_percent}%", (50, 100), 
+                          scale=2, thickness=3,
+                          colorT=(255, 255, 255), colorR=speed_color)
+    
+        # Display motor status
+        status_text = "RUNNING" if motor_running else "STOPPED"
+        status_color = (0, 255, 0) if motor_running else (0, 0, 255)
+        hud.put_text_rect(img, f"Status: {status_text}", (50, 150), 
                           scale=1.5, thickness=2,
-                          colorT=(255, 255, 255), colorR=(0, 0, 255))
+                          colorT=(255, 255, 255), colorR=status_color)
+    
+        # Draw speed indicators for each finger count
+        y_pos = 250
+        for fingers in range(1, 6):
+            speed_val = int(speed_map[fingers] * 100)
+            indicator_color = (0, 255, 0) if finger_count == fingers else (150, 150, 150)
+            hud.put_text_rect(img, f"{fingers} finger(s): {speed_val}%", 
+                              (50, y_pos + (fingers-1)*40), 
+                              scale=1, thickness=1,
+                              colorT=(255, 255, 255), colorR=indicator_color)
+    
+        # Safety warning
+        if speed >= 0.8:
+            hud.put_text_rect(img, "HIGH SPEED!", (450, 50), 
+                              scale=1.5, thickness=2,
+                              colorT=(255, 255, 255), colorR=(0, 0, 255))
+    
+        # Gauge border and instructions
+        hud.draw_static(img)
+
+    # Print the startup breakdown once the motor has been driven for the first time
+    first_actuation = True
 
-try:
-    print("Hand Tracking Motor Control Started")
-    print("Show fingers to control motor speed:")
-    print("1 finger = 50% | 2 = 60% | 3 = 70% | 4 = 80% | 5 = 100%")
-    print("Press 'q' to quit")
+    def report_startup():
+        """Print how long it took from process start to the first motor actuation"""
+        nonlocal first_actuation
+        first_actuation = False
+        startup.mark("first actuation")
+        print(startup.report())
+
+    def handle_frame(img, hands, captured_at, video_time=None):
+        """Drive the motor from the detected hands and show the frame, returns False to quit
+        (video_time is the frame's position in a replayed video, so the gesture filter
+        gives the same result however fast the replay runs)"""
+        stamp = latency.stamp(captured_at)
+        latency.mark(stamp, "detect")
     
-    # Initial motor stop
-    motor.stop()
-    pwm.value = 0
+        # Count the fingers up on every hand in one go, then look up each slot's count
+        # (the hand in slot 0 drives motor A, None when it is not in view)
+        landmarks = HandLandmarks.from_hands(hands)
+        finger_counts = landmarks.finger_counts()
+        counts = {id(hand): int(count) for hand, count in zip(hands, finger_counts)}
+        slots = hand_ids.update(hands)
+        raw_count = counts[id(slots[0])] if 0 in slots else None
     
-    while True:
-        # Capture each frame from the webcam
-        success, img = cap.read()
-        
-        if not success:
-            print("Failed to read from camera")
-            break
-        
-        # Find hands in the current frame
-        hands, img = detector.findHands(img, draw=True, flipType=True)
-        
-        # Check if any hands are detected
+        # Filter the count (stops the motor once the hand has been gone for a while)
+        finger_count = gesture_filter.update(raw_count, now=video_time)
+        if args.two_hands:
+            raw_count_b = counts[id(slots[1])] if 1 in slots else None
+            finger_count_b = gesture_filter_b.update(raw_count_b, now=video_time)
+        latency.mark(stamp, "filter")
+    
+        # Set motor speed based on finger count
+        speed = set_motor_speed(finger_count, stamp)
+        if first_actuation:
+            report_startup()
+        if args.two_hands:
+            speed_b = set_motor_b_speed(finger_count_b)
+        watchdog.heartbeat()
+        if governor is not None:
+            governor.tick(monotonic() - captured_at)
+        timer.lap("actuate")
+    
+        # Print to console
         if hands:
-            # Information for the first hand detected
-            hand1 = hands[0]
-            
-            # Count the number of fingers up
-            fingers1 = detector.fingersUp(hand1)
-            finger_count = fingers1.count(1)
-            
-            # Set motor speed based on finger count
-            speed = set_motor_speed(finger_count)
-            
-            # Draw motor status and indicators
-            draw_motor_status(img, finger_count, speed)
-            
-            # Print to console
-            print(f"Fingers: {finger_count} | Speed: {int(speed*100)}% | Status: {'Running' if motor_running else 'Stopped'}")
-            
+            logger.log("Fingers: {fingers} (raw {raw}) | Speed: {speed}% | Status: {status}",
+                       fingers=finger_count, raw=raw_count, speed=int(speed*100),
+                       status='Running' if motor_running else 'Stopped')
+        timer.lap("log")
+    
+        # Record this frame for offline comparison
+        if recorder is not None:
+            recorder.record(len(hands), raw_count, finger_count, speed, pwm, motor, timer.current)
+        if landmark_log is not None:
+            landmark_log.record(captured_at, landmarks)
+    
+        if args.headless:
+            return True
+    
+        # Draw motor status and indicators (the gauge shows the speed asked for - the ramp in
+        # between would render a new HUD sprite for every duty cycle step)
+        draw_motor_status(img, finger_count, speed)
+    
+        # Label each hand with the motor it drives
+        for slot, hand in slots.items():
+            x, y, _, _ = hand["bbox"]
+            hud.put_text_rect(img, f"Motor {'AB'[slot]}", (x, max(y - 40, 20)),
+                              scale=1, thickness=1,
+                              colorT=(255, 255, 255), colorR=(255, 128, 0))
+    
+        if args.two_hands:
+            # Display motor B info
+            hud.put_text_rect(img, f"Motor B: {finger_count_b} fingers | {int(speed_b * 100)}%", (50, 200),
+                             scale=1, thickness=1,
+                             colorT=(255, 255, 255), colorR=(128, 128, 255))
+        elif hands:
             # Check if a second hand is detected
             if len(hands) == 2:
-                hand2 = hands[1]
-                fingers2 = detector.fingersUp(hand2)
-                hand2_count = fingers2.count(1)
-                
+                hand2_count = next(counts[id(hand)] for hand in hands if hand is not slots.get(0))
+            
                 # Display second hand info
-                cvzone.putTextRect(img, f"Hand 2: {hand2_count} fingers (ignored)", (50, 200),
+                hud.put_text_rect(img, f"Hand 2: {hand2_count} fingers (ignored)", (50, 200),
                                  scale=1, thickness=1,
                                  colorT=(255, 255, 255), colorR=(128, 128, 255))
         else:
-            # No hands detected - stop motor
-            set_motor_speed(0)
-            
             # Display status when no hands detected
-            draw_motor_status(img, 0, 0)
-            cvzone.putTextRect(img, "No hands detected - Motor STOPPED", (50, 200),
+            hud.put_text_rect(img, "No hands detected - Motor STOPPED", (50, 200),
                              scale=1.5, thickness=2,
                              colorT=(255, 255, 255), colorR=(128, 128, 128))
-        
-        # Display instructions
-        cvzone.putTextRect(img, "L298N Motor Control | Press 'q' to quit", 
-                          (50, 470), scale=1, thickness=1,
-                          colorT=(255, 255, 255), colorR=(0, 0, 0))
-        
+        timer.lap("draw")
+    
         # Display the image in a window
         cv2.imshow("Hand Tracking - DC Motor Control", img)
-        
+    
         # Exit on 'q' key press
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+        key = cv2.waitKey(1) & 0xFF
+        timer.lap("display")
+        if key == ord('q'):
             print("\nStopping motor and exiting...")
-            break
-
-except KeyboardInterrupt:
-    print("\nProgram interrupted by user")
-
-finally:
-    # Clean up - stop motor and release resources
-    print("Performing cleanup...")
-    motor.stop()
-    pwm.value = 0
-    pwm.close()
-    motor.close()
-    cap.release()
-    cv2.destroyAllWindows()
-    print("Cleanup complete - Motor stopped and resources released")
\ No newline at end of file
+            return False
+        return True
+
+    # Main loop keeps going until 'q' is pressed or a stop signal arrives
+    running = True
+
+    def request_stop(signum, frame):
+        """Stop the main loop cleanly when a signal arrives"""
+        nonlocal running
+        running = False
+
+    signal.signal(signal.SIGTERM, request_stop)
+    if args.headless:
+        signal.signal(signal.SIGINT, request_stop)
+
+    # Per-stage timing breakdown, printed every few seconds
+    timer = StageTimer()
+
+    try:
+        print("Hand Tracking Motor Control Started")
+        print("Show fingers to control motor speed:")
+        print("1 finger = 50% | 2 = 60% | 3 = 70% | 4 = 80% | 5 = 100%")
+        if args.headless:
+            print("Headless mode - press Ctrl+C to quit")
+        else:
+            print("Press 'q' to quit")
+    
+        # Initial motor stop
+        motor.stop()
+        pwm.value = 0
+    
+        for controller in motor_controllers:
+            controller.start()
+        watchdog.start()
+        grabber.start()
+        startup.mark("start threads")
+        last_report = monotonic()
+        capture_times = {}  # frame_id -> capture and video time for frames out with the worker pool
+        hands_visible = False  # Keeps the motion gate open while a hand is in view
+    
+        while running:
+            timer.start_frame()
+        
+            # Get the newest frame from the capture thread
+            success, img = grabber.read()
+            timer.lap("capture")
+        
+            if not success:
+                print("End of video" if replaying else "Failed to read from camera")
+                if pool is not None and replaying:
+                    # The last frames of the video are still with the workers - finish them too
+                    try:
+                        for frame_id, frame, hands in pool.drain():
+                            handle_frame(frame, hands, *capture_times.pop(frame_id))
+                    except (RuntimeError, TimeoutError) as e:
+                        print(f"Detector workers failed ({e}) - last frames lost")
+                break
+            if img is None:
+                # Camera stalled - the watchdog has stopped the motor, carry on once frames are back
+                logger.log("No frame from the camera - waiting")
+                continue
+        
+            # A replayed video runs on its own clock (seconds into the video), so replays are repeatable
+            video_time = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000 if replaying else None
+        
+            if gate is not None and not gate.check(img, hands_visible=hands_visible, now=video_time):
+                # Nothing moving and no hand in view - skip hand detection entirely
+                results = [(img, [], grabber.last_timestamp, video_time)]
+            elif pool is not None:
+                # Hand the frame to the worker pool and take whatever is finished, in capture order
+                try:
+                    frame_id = pool.submit(img)
+                    capture_times[frame_id] = (grabber.last_timestamp, video_time)
+                    finished = pool.results()
+                except (RuntimeError, TimeoutError) as e:
+                    # A worker died or hangs - carry on with the detector in this process
+                    print(f"Detector workers failed ({e}) - detecting in this process")
+                    pool.close()
+                    pool = None
+                    capture_times.clear()
+                    hands, img = detector.findHands(img, draw=not args.headless, flipType=True)
+                    finished = []
+                    results = [(img, hands, grabber.last_timestamp, video_time)]
+                else:
+                    results = []
+                for frame_id, frame, hands in finished:
+                    if not args.headless:
+                        for hand in hands:
+                            draw_hand(frame, hand)
+                    results.append((frame, hands, *capture_times.pop(frame_id)))
+            else:
+                # Use the new detector if the quality governor had one loaded in the background
+                if governor is not None:
+                    swap_detector()
+            
+                # Find hands in the current frame (no drawing when headless)
+                hands, img = detector.findHands(img, draw=not args.headless, flipType=True)
+                results = [(img, hands, grabber.last_timestamp, video_time)]
+            timer.lap("detect")
+            if results:
+                hands_visible = bool(results[-1][1])
+        
+            # Handle each finished frame (stops early if 'q' was pressed)
+            if not all(handle_frame(*result) for result in results):
+                break
+        
+            timer.end_frame()
+        
+            # Print the stage timing breakdown every few seconds
+            if monotonic() - last_report >= args.timing_interval:
+                print(timer.report())
+                print(f"  Frame age: {grabber.last_age*1000:.0f}ms | Dropped frames: {grabber.dropped}")
+                timer.reset()
+                last_report = monotonic()
+    
+        if not running:
+            print("\nStop signal received - stopping motor and exiting...")
+
+    except KeyboardInterrupt:
+        print("\nProgram interrupted by user")
+
+    finally:
+        # Clean up - stop motor and release resources
+        watchdog.stop()
+        logger.close()  # After the watchdog, so its last message still gets written
+        print("Performing cleanup...")
+        for controller in motor_controllers:
+            controller.stop()
+        motor.stop()
+        pwm.value = 0
+        pwm.close()
+        motor.close()
+        if args.two_hands:
+            pwm_b.close()
+            motor_b.close()
+        if pir is not None:
+            pir.close()
+        grabber.stop()
+        cap.release()
+        if recorder is not None:
+            recorder.close()
+        if landmark_log is not None:
+            landmark_log.close()
+            stats = landmark_log.stats()
+            print(f"Landmark log: {stats['frames']} frames | {stats['bytes'] / 1024:.0f} KB | {stats['writes']} writes")
+        if not args.headless:
+            cv2.destroyAllWindows()
+        stats = grabber.stats()
+        print(f"Frames captured: {stats['captured']} | Processed: {stats['delivered']} | Dropped: {stats['dropped']}")
+        pre_stats = scaled_detector.preprocess.stats()
+        print(f"Frame allocations: {stats['allocations']} capture | {pre_stats['allocations']} preprocessing "
+              f"({(stats['allocations'] + pre_stats['allocations']) / max(stats['captured'], 1):.2f} per frame)")
+        if pool is not None:
+            pool.close()
+            stats = pool.stats()
+            print(f"Detector workers: {stats['workers']} | Frames: {stats['completed']} | "
+                  f"Mean latency: {stats['mean_latency_ms']:.1f}ms | Max latency: {stats['max_latency_ms']:.1f}ms")
+        print(f"Full detections: {detector.detections} | Tracked frames: {detector.tracked_frames} | "
+              f"Tracking failures: {detector.tracking_failures}")
+        if USE_ROI_CROP:
+            print(f"ROI detections: {hand_detector.roi_frames} | Full-frame searches: {hand_detector.full_frames} | "
+                  f"ROI misses: {hand_detector.roi_misses}")
+        print(f"Gesture changes: {gesture_filter.raw_changes} raw | {gesture_filter.transitions} after filtering")
+        stats = hand_ids.stats()
+        print(f"Hands tracked: {stats['new_hands']} new | {stats['lost_hands']} lost")
+        log_stats = logger.stats()
+        print(f"Log lines: {log_stats['written']} written | {log_stats['coalesced']} merged | "
+              f"{log_stats['skipped']} rate limited")
+        if gate is not None:
+            print(f"Motion gate: {gate.skipped} of {gate.checked} frames skipped")
+        if governor is not None:
+            print(f"Quality changes: {governor.changes} | Final level: {governor.level}")
+        print(f"GPIO writes: {outputs.writes + outputs_b.writes} | "
+              f"Suppressed: {outputs.suppressed + outputs_b.suppressed}")
+        stats = watchdog.stats()
+        print(f"Watchdog trips: {stats['trips']} | Longest stall: {stats['longest_stall_ms']:.0f}ms")
+        stats = motor_controller.stats()
+        print(f"Motor control ticks: {stats['ticks']} | Late: {stats['late_ticks']} | "
+              f"Max lateness: {stats['max_lateness_ms']:.1f}ms")
+        print(timer.report())
+        print(latency.report())
+        print("Cleanup complete - Motor stopped and resources released")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,107 @@
-from cvzone.HandTrackingModule import HandDetector
 import cv2
-from gpiozero import LED
 import cvzone
+from camera_profile import open_camera
+from fast_start import StartupProfiler, warm_up
+from vision_server import connect_hand_detector
+from frame_grabber import FrameGrabber
+from hud_compositor import HudCompositor
+from gpio_output_cache import OutputStateCache
+from gesture_filter import GestureFilter
+from landmark_array import HandLandmarks
+from async_log import AsyncLogger
+from tracking_hand_detector import TrackingHandDetector
+from roi_hand_detector import RoiHandDetector
+from scaled_hand_detector import ScaledHandDetector
 
-# Initialize LEDs on different GPIO pins
-led1 = LED(17)  # LED for 1 finger - GPIO 17
-led2 = LED(27)  # LED for 2 fingers - GPIO 27
-led3 = LED(22)  # LED for 3 fingers - GPIO 22
+# Time every startup step up to the first LED update
+startup = StartupProfiler()
 
-# Initialize the webcam to capture video
-# Use 0 for the default camera on Raspberry Pi
-cap = cv2.VideoCapture(0)
+def init_leds():
+    """Initialize LEDs on different GPIO pins"""
+    from gpiozero import LED
+    led1 = LED(17)  # LED for 1 finger - GPIO 17
+    led2 = LED(27)  # LED for 2 fingers - GPIO 27
+    led3 = LED(22)  # LED for 3 fingers - GPIO 22
+    return led1, led2, led3
 
-# Initialize the HandDetector class with the given parameters
-detector = HandDetector(staticMode=False, maxHands=2, modelComplexity=1, detectionCon=0.5, minTrackCon=0.5)
+# Open the webcam, set up the LEDs and load the hand model at the same time
+# (the webcam uses the low-latency camera profile - 0 is the default camera on Raspberry Pi,
+# and the hand model attaches to vision_server.py in milliseconds if it is running)
+parts = startup.run_parallel({
+    "camera": lambda: open_camera(0),
+    "gpio": init_leds,
+    "hand model": lambda: connect_hand_detector(staticMode=False, maxHands=2, modelComplexity=1,
+                                                detectionCon=0.5, minTrackCon=0.5),
+})
+cap = parts["camera"]
+led1, led2, led3 = parts["gpio"]
+
+# Run the model once on a blank frame so the first real frame is not slow
+warm_up(parts["hand model"], startup)
+
+# Read frames on a background thread so the LEDs always react to the newest frame
+# (into a few reused buffers instead of a new image per frame)
+grabber = FrameGrabber(cap, buffer_size=2, reuse_buffers=True)
+
+# Run full hand detection every N frames and track landmarks in between (1 = detect every frame)
+DETECT_EVERY_N_FRAMES = 3
+
+# Run hand detection on a downscaled copy of each frame (1.0 = full resolution)
+# Overlays stay at full resolution - see benchmark_inference_scale.py to pick a value
+INFERENCE_SCALE = 0.5
+
+# Only search a crop around the last hand position (full-frame search when the hand is lost)
+USE_ROI_CROP = True
+
+# Use the HandDetector loaded at startup
+hand_detector = parts["hand model"]
+if INFERENCE_SCALE < 1.0:
+    hand_detector = ScaledHandDetector(hand_detector, scale=INFERENCE_SCALE)
+if USE_ROI_CROP:
+    hand_detector = RoiHandDetector(hand_detector, margin=0.6)
+
+# Wrap the detector with landmark tracking
+detector = TrackingHandDetector(hand_detector, detect_every=DETECT_EVERY_N_FRAMES)
+
+# Status lines go through a background writer (at most 5 lines per second, repeats merged)
+logger = AsyncLogger(max_rate=5)
 
 # LED status dictionary
 led_status = {1: False, 2: False, 3: False}
 
+# Smooth out misdetected frames before they reach the LEDs (majority vote over 5 frames,
+# 0.25 s minimum between changes, last LED held 0.5 s after the hand is lost)
+gesture_filter = GestureFilter(window=5, min_dwell=0.25, hold_timeout=0.5)
+
+# Only LEDs that change get written (holding a gesture does not flicker the LEDs)
+outputs = OutputStateCache()
+
 def control_leds(finger_count):
     """Control LEDs based on finger count"""
-    # Turn off all LEDs first
-    led1.off()
-    led2.off()
-    led3.off()
-    led_status[1] = False
-    led_status[2] = False
-    led_status[3] = False
-    
-    # Turn on appropriate LED based on finger count
-    if finger_count == 1:
-        led1.on()
-        led_status[1] = True
-    elif finger_count == 2:
-        led2.on()
-        led_status[2] = True
-    elif finger_count == 3:
-        led3.on()
-        led_status[3] = True
+    # Light the LED that matches the finger count - the others go off first
+    outputs.set_group([
+        (led1, 1 if finger_count == 1 else 0),
+        (led2, 1 if finger_count == 2 else 0),
+        (led3, 1 if finger_count == 3 else 0),
+    ])
+    led_status[1] = finger_count == 1
+    led_status[2] = finger_count == 2
+    led_status[3] = finger_count == 3
     
     return led_status
 
+# HUD overlays are rendered once and reused every frame
+hud = HudCompositor(max_sprites=64)
+
+def draw_static_hud(img):
+    """Draw the overlay elements that never change"""
+    # Display instructions
+    cvzone.putTextRect(img, "1 finger = LED1 | 2 fingers = LED2 | 3 fingers = LED3", 
+                      (50, 450), scale=1, thickness=1,
+                      colorT=(255, 255, 255), colorR=(0, 0, 0))
+
+hud.add_static(draw_static_hud)
+
 def draw_led_indicators(img, led_status, finger_count):
     """Draw LED status indicators on the image"""
     # Base positions for LED indicators
@@ -50,56 +111,58 @@ def draw_led_indicators(img, led_status, finger_count):
     
     # LED 1 Indicator
     color1 = (0, 255, 0) if led_status[1] else (100, 100, 100)
-    cvzone.putTextRect(img, "LED1", (x_start, y_start), 
+    hud.put_text_rect(img, "LED1", (x_start, y_start), 
                       scale=1.5, thickness=2,
                       colorT=(255, 255, 255), colorR=color1)
-    cv2.circle(img, (x_start + 70, y_start - 10), 15, color1, cv2.FILLED)
+    hud.circle(img, (x_start + 70, y_start - 10), 15, color1)
     
     # LED 2 Indicator
     color2 = (0, 255, 0) if led_status[2] else (100, 100, 100)
-    cvzone.putTextRect(img, "LED2", (x_start + spacing, y_start), 
+    hud.put_text_rect(img, "LED2", (x_start + spacing, y_start), 
                       scale=1.5, thickness=2,
                       colorT=(255, 255, 255), colorR=color2)
-    cv2.circle(img, (x_start + spacing + 70, y_start - 10), 15, color2, cv2.FILLED)
+    hud.circle(img, (x_start + spacing + 70, y_start - 10), 15, color2)
     
     # LED 3 Indicator
     color3 = (0, 255, 0) if led_status[3] else (100, 100, 100)
-    cvzone.putTextRect(img, "LED3", (x_start + spacing*2, y_start), 
+    hud.put_text_rect(img, "LED3", (x_start + spacing*2, y_start), 
                       scale=1.5, thickness=2,
                       colorT=(255, 255, 255), colorR=color3)
-    cv2.circle(img, (x_start + spacing*2 + 70, y_start - 10), 15, color3, cv2.FILLED)
+    hud.circle(img, (x_start + spacing*2 + 70, y_start - 10), 15, color3)
     
     # Display finger count
-    cvzone.putTextRect(img, f"Fingers: {finger_count}", (50, 120), 
+    hud.put_text_rect(img, f"Fingers: {finger_count}", (50, 120), 
                       scale=2, thickness=3,
                       colorT=(255, 255, 255), colorR=(255, 0, 255))
     
     # Display instructions
-    cvzone.putTextRect(img, "1 finger = LED1 | 2 fingers = LED2 | 3 fingers = LED3", 
-                      (50, 450), scale=1, thickness=1,
-                      colorT=(255, 255, 255), colorR=(0, 0, 0))
+    hud.draw_static(img)
 
 try:
+    grabber.start()
+    
     # Continuously get frames from the webcam
     while True:
-        # Capture each frame from the webcam
-        success, img = cap.read()
+        # Get the newest frame from the capture thread
+        success, img = grabber.read()
         
         if not success:
             print("Failed to read from camera")
             break
+        if img is None:
+            # No new frame yet (camera stalled or still starting) - try again
+            continue
         
         # Find hands in the current frame
         hands, img = detector.findHands(img, draw=True, flipType=True)
         
         # Check if any hands are detected
         if hands:
-            # Information for the first hand detected
-            hand1 = hands[0]
+            # Count the number of fingers up for every hand in one go
+            finger_counts = HandLandmarks.from_hands(hands).finger_counts()
             
-            # Count the number of fingers up for the first hand
-            fingers1 = detector.fingersUp(hand1)
-            finger_count = fingers1.count(1)
+            # The first hand controls the LEDs
+            finger_count = gesture_filter.update(int(finger_counts[0]))
             
             # Control LEDs based on finger count
             led_status = control_leds(finger_count)
@@ -107,36 +170,39 @@ try:
             # Draw LED indicators
             draw_led_indicators(img, led_status, finger_count)
             
-            # Print to console
-            status_str = f"Fingers: {finger_count} | "
-            status_str += f"LED1: {'ON' if led_status[1] else 'OFF'} | "
-            status_str += f"LED2: {'ON' if led_status[2] else 'OFF'} | "
-            status_str += f"LED3: {'ON' if led_status[3] else 'OFF'}"
-            print(status_str)
+            # Print to console (formatted and written by the logger thread)
+            logger.log("Fingers: {fingers} | LED1: {led1} | LED2: {led2} | LED3: {led3}",
+                       fingers=finger_count,
+                       led1='ON' if led_status[1] else 'OFF',
+                       led2='ON' if led_status[2] else 'OFF',
+                       led3='ON' if led_status[3] else 'OFF')
             
             # Check if a second hand is detected
             if len(hands) == 2:
-                hand2 = hands[1]
-                fingers2 = detector.fingersUp(hand2)
-                hand2_count = fingers2.count(1)
+                hand2_count = int(finger_counts[1])
                 
                 # Display second hand info
-                cvzone.putTextRect(img, f"Hand 2: {hand2_count} fingers", (50, 160),
+                hud.put_text_rect(img, f"Hand 2: {hand2_count} fingers", (50, 160),
                                  scale=1.5, thickness=2,
                                  colorT=(255, 255, 255), colorR=(128, 128, 255))
         else:
-            # No hands detected - turn off all LEDs
-            led1.off()
-            led2.off()
-            led3.off()
-            led_status = {1: False, 2: False, 3: False}
+            # No hands detected - LEDs go off once the hold timeout has passed
+            finger_count = gesture_filter.update(None)
+            led_status = control_leds(finger_count)
             
             # Display status when no hands detected
-            draw_led_indicators(img, led_status, 0)
-            cvzone.putTextRect(img, "No hands detected - All LEDs OFF", (50, 200),
+            draw_led_indicators(img, led_status, finger_count)
+            no_hands_text = "No hands detected - All LEDs OFF" if finger_count == 0 else "No hands detected - holding"
+            hud.put_text_rect(img, no_hands_text, (50, 200),
                              scale=1.5, thickness=2,
                              colorT=(255, 255, 255), colorR=(128, 128, 128))
         
+        # Print the startup breakdown once the LEDs have been set for the first time
+        if startup is not None:
+            startup.mark("first actuation")
+            print(startup.report())
+            startup = None
+        
         # Display the image in a window
         cv2.imshow("Hand Tracking - Multiple LED Control", img)
         
@@ -150,12 +216,24 @@ except KeyboardInterrupt:
 
 finally:
     # Clean up - turn off all LEDs
+    logger.close()
     led1.off()
     led2.off()
     led3.off()
     led1.close()
     led2.close()
     led3.close()
+    grabber.stop()
     cap.release()
     cv2.destroyAllWindows()
+    stats = grabber.stats()
+    print(f"Frames captured: {stats['captured']} | Processed: {stats['delivered']} | Dropped: {stats['dropped']} | "
+          f"Last frame age: {stats['age_ms']:.0f}ms")
+    print(f"Full detections: {detector.detections} | Tracked frames: {detector.tracked_frames} | "
+          f"Tracking failures: {detector.tracking_failures}")
+    if USE_ROI_CROP:
+        print(f"ROI detections: {hand_detector.roi_frames} | Full-frame searches: {hand_detector.full_frames} | "
+              f"ROI misses: {hand_detector.roi_misses}")
+    print(f"Gesture changes: {gesture_filter.raw_changes} raw | {gesture_filter.transitions} after filtering")
+    print(f"GPIO writes: {outputs.writes} | Suppressed: {outputs.suppressed}")
     print("Cleanup complete - All LEDs turned off and resources released")
\ No newline at end of file
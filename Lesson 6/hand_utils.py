@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Hand Utilities
+Shared helpers for building and drawing cvzone-style hand dictionaries
+"""
+
+import cv2
+
+# Landmark pairs that make up the hand skeleton (same as MediaPipe HAND_CONNECTIONS)
+HAND_CONNECTIONS = [
+    (0, 1), (1, 2), (2, 3), (3, 4),          # Thumb
+    (0, 5), (5, 6), (6, 7), (7, 8),          # Index finger
+    (5, 9), (9, 10), (10, 11), (11, 12),     # Middle finger
+    (9, 13), (13, 14), (14, 15), (15, 16),   # Ring finger
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)  # Pinky and palm
+]
+
+
+def build_hand(lmList, hand_type):
+    """Build a hand dictionary (lmList, bbox, center, type) like cvzone does"""
+    xList = [lm[0] for lm in lmList]
+    yList = [lm[1] for lm in lmList]
+
+    # Bounding box around all landmarks
+    xmin, xmax = min(xList), max(xList)
+    ymin, ymax = min(yList), max(yList)
+    bbox = (xmin, ymin, xmax - xmin, ymax - ymin)
+    center = (bbox[0] + bbox[2] // 2, bbox[1] + bbox[3] // 2)
+
+    return {"lmList": lmList, "bbox": bbox, "center": center, "type": hand_type}
+
+
+def hands_from_results(results, width, height, flipType=True):
+    """Turn MediaPipe Hands results into hand dictionaries for a width x height frame"""
+    hands = []
+    if not results.multi_hand_landmarks:
+        return hands
+
+    for handedness, handLms in zip(results.multi_handedness, results.multi_hand_landmarks):
+        # Landmarks are normalised (0-1), so they scale straight to any frame size
+        lmList = [[int(lm.x * width), int(lm.y * height), int(lm.z * width)] for lm in handLms.landmark]
+        hand_type = handedness.classification[0].label
+        if flipType:
+            # MediaPipe assumes a mirrored image - swap the label like cvzone does
+            hand_type = "Left" if hand_type == "Right" else "Right"
+        hands.append(build_hand(lmList, hand_type))
+    return hands
+
+
+def draw_hand(img, hand):
+    """Draw landmarks, bounding box and hand type like cvzone's findHands"""
+    lmList = hand["lmList"]
+    for start, end in HAND_CONNECTIONS:
+        cv2.line(img, tuple(lmList[start][0:2]), tuple(lmList[end][0:2]), (255, 255, 255), 2)
+    for lm in lmList:
+        cv2.circle(img, (lm[0], lm[1]), 4, (0, 0, 255), cv2.FILLED)
+
+    x, y, w, h = hand["bbox"]
+    cv2.rectangle(img, (x - 20, y - 20), (x + w + 20, y + h + 20), (255, 0, 255), 2)
+    cv2.putText(img, hand["type"], (x - 30, y - 30), cv2.FONT_HERSHEY_PLAIN,
+                2, (255, 0, 255), 2)
+
+
+def fingers_up(hand):
+    """Return [thumb, index, middle, ring, pinky] (1 = up) like cvzone's fingersUp"""
+    lmList = hand["lmList"]
+    tipIds = [4, 8, 12, 16, 20]
+    fingers = []
+
+    # Thumb - compares x because the thumb folds sideways
+    if hand["type"] == "Right":
+        fingers.append(1 if lmList[tipIds[0]][0] > lmList[tipIds[0] - 1][0] else 0)
+    else:
+        fingers.append(1 if lmList[tipIds[0]][0] < lmList[tipIds[0] - 1][0] else 0)
+
+    # 4 Fingers - tip above the middle joint means the finger is up
+    for id in range(1, 5):
+        fingers.append(1 if lmList[tipIds[id]][1] < lmList[tipIds[id] - 2][1] else 0)
+
+    return fingers
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Hardware PWM Output
+- Drives a hardware PWM channel through the sysfs pwmchip interface
+  instead of gpiozero's software PWM: no CPU cost and no jitter under vision load
+- Same .value / .frequency / on() / off() / close() API as gpiozero's PWMOutputDevice,
+  so it drops into Motor control code, OutputStateCache and MotorController
+- The pin must be switched to its PWM function first, in /boot/firmware/config.txt:
+      dtoverlay=pwm-2chan,pin=18,func=3,pin2=19,func2=3
+  (Pi 5: GPIO 12/13/18/19 are RP1 PWM0 channels 0-3; reboot after editing)
+- The RP1 PWM0 pwmchip is found by its device link (its number changes with the
+  kernel and other overlays); pass chip= when it cannot be identified
+- The sysfs root can point at a fake tree (create_fake_sysfs) to try it without a Pi
+
+Usage:
+    from hardware_pwm import HardwarePWM
+    pwm = HardwarePWM(18, frequency=1000)
+    pwm.value = 0.5
+"""
+
+import os
+from time import sleep
+
+SYSFS_PWM = "/sys/class/pwm"
+
+# RP1 PWM0 channel for each PWM-capable header pin on the Pi 5
+PIN_CHANNELS = {12: 0, 13: 1, 18: 2, 19: 3}
+
+# Device tree node of the RP1 PWM0 controller (what pwmchipN/device links to on a Pi 5)
+RP1_PWM0 = "1f00098000.pwm"
+
+# Pins switched to their PWM function by the overlay line above
+# (a channel on any other pin runs, but nothing reaches the header)
+OVERLAY_PINS = (18, 19)
+
+
+def read_sysfs(path):
+    """Read a sysfs attribute as text"""
+    with open(path) as f:
+        return f.read().strip()
+
+
+def write_sysfs(path, value):
+    """Write a value to a sysfs attribute"""
+    with open(path, "w") as f:
+        f.write(str(value))
+
+
+def find_chip(root=SYSFS_PWM, channel=0, device=RP1_PWM0):
+    """Return the pwmchip number of the PWM controller, None if it cannot be told apart"""
+    if not os.path.isdir(root):
+        return None
+    chips = sorted(int(name[len("pwmchip"):]) for name in os.listdir(root)
+                   if name.startswith("pwmchip") and name[len("pwmchip"):].isdigit())
+    candidates = []
+    for chip in chips:
+        chip_dir = os.path.join(root, f"pwmchip{chip}")
+        if channel >= int(read_sysfs(os.path.join(chip_dir, "npwm"))):
+            continue
+        link = os.path.join(chip_dir, "device")
+        if os.path.exists(link) and os.path.basename(os.path.realpath(link)) == device:
+            return chip
+        candidates.append(chip)
+    # No device link to go by - only a single candidate is safe to pick
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def create_fake_sysfs(root, chip=0, npwm=4):
+    """Build a fake sysfs pwmchip tree (exported channels already present)"""
+    chip_dir = os.path.join(root, f"pwmchip{chip}")
+    os.makedirs(chip_dir, exist_ok=True)
+    write_sysfs(os.path.join(chip_dir, "npwm"), npwm)
+    write_sysfs(os.path.join(chip_dir, "export"), "")
+    write_sysfs(os.path.join(chip_dir, "unexport"), "")
+    for channel in range(npwm):
+        channel_dir = os.path.join(chip_dir, f"pwm{channel}")
+        os.makedirs(channel_dir, exist_ok=True)
+        for name, value in [("period", 0), ("duty_cycle", 0), ("enable", 0), ("polarity", "normal")]:
+            write_sysfs(os.path.join(channel_dir, name), value)
+    return root
+
+
+class HardwarePWM:
+    """PWMOutputDevice look-alike backed by a sysfs hardware PWM channel"""
+
+    def __init__(self, pin=18, frequency=1000, initial_value=0, chip=None, channel=None,
+                 root=SYSFS_PWM):
+        self.pin = pin
+        self.channel = PIN_CHANNELS.get(pin) if channel is None else channel
+        if self.channel is None:
+            raise ValueError(f"GPIO {pin} has no hardware PWM channel (use 12, 13, 18 or 19)")
+
+        self.chip = find_chip(root, self.channel) if chip is None else chip
+        if self.chip is None:
+            raise RuntimeError(f"No {RP1_PWM0} pwmchip under {root} - is the PWM overlay enabled in "
+                               f"config.txt? (pass the chip number if it has a different name)")
+        self.chip_dir = os.path.join(root, f"pwmchip{self.chip}")
+        self.dir = os.path.join(self.chip_dir, f"pwm{self.channel}")
+
+        self._export()
+        self._period_ns = 0
+        self._value = 0.0
+        self.closed = False
+
+        # Period before duty cycle - the kernel rejects a duty cycle longer than the period
+        write_sysfs(os.path.join(self.dir, "duty_cycle"), 0)
+        self.frequency = frequency
+        self.value = initial_value
+        write_sysfs(os.path.join(self.dir, "enable"), 1)
+
+    def _export(self):
+        """Export the channel and wait for udev to make it writable"""
+        if not os.path.isdir(self.dir):
+            write_sysfs(os.path.join(self.chip_dir, "export"), self.channel)
+        for _ in range(50):
+            if os.access(os.path.join(self.dir, "duty_cycle"), os.W_OK):
+                return
+            sleep(0.02)
+        raise RuntimeError(f"{self.dir} did not appear after export")
+
+    @property
+    def frequency(self):
+        """PWM frequency in Hz"""
+        return 1_000_000_000 / self._period_ns
+
+    @frequency.setter
+    def frequency(self, hz):
+        period_ns = int(1_000_000_000 / hz)
+        # Drop the duty cycle first so it never exceeds a shorter new period
+        write_sysfs(os.path.join(self.dir, "duty_cycle"), 0)
+        write_sysfs(os.path.join(self.dir, "period"), period_ns)
+        self._period_ns = period_ns
+        if self._value:
+            self.value = self._value
+
+    @property
+    def value(self):
+        """Duty cycle from 0 to 1"""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        if not 0 <= value <= 1:
+            raise ValueError("PWM value must be between 0 and 1")
+        write_sysfs(os.path.join(self.dir, "duty_cycle"), int(self._period_ns * value))
+        self._value = value
+
+    @property
+    def is_active(self):
+        """True while the duty cycle is above 0"""
+        return self._value > 0
+
+    def on(self):
+        """Full duty cycle"""
+        self.value = 1
+
+    def off(self):
+        """Zero duty cycle"""
+        self.value = 0
+
+    def close(self):
+        """Switch the output off and give the channel back to the kernel"""
+        if self.closed:
+            return
+        self.value = 0
+        write_sysfs(os.path.join(self.dir, "enable"), 0)
+        write_sysfs(os.path.join(self.chip_dir, "unexport"), self.channel)
+        self.closed = True
+
+    def __repr__(self):
+        return (f"<HardwarePWM pin={self.pin} pwmchip{self.chip}/pwm{self.channel} "
+                f"frequency={self.frequency:.0f}Hz value={self._value}>")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+HUD Compositor
+- Static overlay elements (banners, borders) are rendered once into a layer
+- Dynamic text boxes and shapes are rendered once per unique look and cached
+  as sprites in a bounded LRU cache (keyed by their text, size and colors)
+- Each frame only copies ready-made pixels onto the image with a vectorized
+  mask copy instead of rasterizing fonts again
+"""
+
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+
+class HudCompositor:
+    """Cache overlay sprites and blend them onto frames"""
+
+    def __init__(self, max_sprites=64):
+        self.max_sprites = max_sprites
+        self.sprites = OrderedDict()  # key -> (pixels, mask, anchor)
+
+        self.static_draws = []   # Functions that draw the static elements
+        self.static_layer = None  # (shape, pixels, mask, (x0, y0)) built on first use
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Static layer
+    # ------------------------------------------------------------------
+    def add_static(self, draw_fn):
+        """Register a function draw_fn(img) that draws elements that never change"""
+        self.static_draws.append(draw_fn)
+        self.static_layer = None
+
+    def draw_static(self, img):
+        """Blend the static layer onto the frame"""
+        if not self.static_draws:
+            return img
+        if self.static_layer is None or self.static_layer[0] != img.shape:
+            self.static_layer = self._render_static(img.shape)
+
+        _, pixels, mask, (x0, y0) = self.static_layer
+        if mask is not None:
+            h, w = mask.shape
+            np.copyto(img[y0:y0 + h, x0:x0 + w], pixels, where=mask[..., None])
+        return img
+
+    def _render_static(self, shape):
+        """Run the static draw functions once and keep only the pixels they touched"""
+        # Drawing on a black and a white canvas shows which pixels were painted
+        black = np.zeros(shape, dtype=np.uint8)
+        white = np.full(shape, 255, dtype=np.uint8)
+        for draw_fn in self.static_draws:
+            draw_fn(black)
+            draw_fn(white)
+        mask = (black != 0).any(axis=2) | (white != 255).any(axis=2)
+
+        # Crop to the painted area so the per-frame copy stays small
+        ys, xs = np.nonzero(mask)
+        if len(ys) == 0:
+            return shape, None, None, (0, 0)
+        y0, y1 = ys.min(), ys.max() + 1
+        x0, x1 = xs.min(), xs.max() + 1
+        pixels = np.where(mask[..., None], black, white)[y0:y1, x0:x1].copy()
+        return shape, pixels, mask[y0:y1, x0:x1].copy(), (x0, y0)
+
+    # ------------------------------------------------------------------
+    # Cached sprites
+    # ------------------------------------------------------------------
+    def put_text_rect(self, img, text, pos, scale=3, thickness=3, colorT=(255, 255, 255),
+                      colorR=(255, 0, 255), font=cv2.FONT_HERSHEY_PLAIN, offset=10):
+        """Cached version of cvzone.putTextRect (same arguments and placement)"""
+        key = ("text", text, scale, thickness, colorT, colorR, font, offset)
+        sprite = self._get(key, lambda: self._render_text(text, scale, thickness,
+                                                           colorT, colorR, font, offset))
+        self._blit(img, sprite, pos)
+        return img
+
+    def circle(self, img, center, radius, color):
+        """Cached filled circle"""
+        key = ("circle", radius, color)
+        sprite = self._get(key, lambda: self._render_circle(radius, color))
+        self._blit(img, sprite, center)
+        return img
+
+    def rectangle(self, img, pt1, pt2, color):
+        """Cached filled rectangle between two corners"""
+        width, height = pt2[0] - pt1[0] + 1, pt2[1] - pt1[1] + 1
+        if width <= 0 or height <= 0:
+            return img
+        key = ("rect", width, height, color)
+        sprite = self._get(key, lambda: (np.full((height, width, 3), color, dtype=np.uint8),
+                                         None, (0, 0)))
+        self._blit(img, sprite, pt1)
+        return img
+
+    def _get(self, key, render):
+        """Look up a sprite in the LRU cache, rendering it on a miss"""
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = render()
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_sprites:
+            self.sprites.popitem(last=False)  # Forget the least recently used sprite
+        return sprite
+
+    def _render_text(self, text, scale, thickness, colorT, colorR, font, offset):
+        """Render a text box the way cvzone.putTextRect draws it"""
+        (w, h), baseline = cv2.getTextSize(text, font, scale, thickness)
+        # Leave room for descenders that can poke out below the box
+        bottom = max(offset, baseline + thickness)
+        height, width = h + offset + bottom + 1, w + 2 * offset + 1
+
+        pixels = np.zeros((height, width, 3), dtype=np.uint8)
+        mask = np.zeros((height, width), dtype=np.uint8)
+        origin = (offset, h + offset)
+        box = ((0, 0), (width - 1, h + 2 * offset))
+
+        cv2.rectangle(pixels, box[0], box[1], colorR, cv2.FILLED)
+        cv2.rectangle(mask, box[0], box[1], 255, cv2.FILLED)
+        cv2.putText(pixels, text, origin, font, scale, colorT, thickness)
+        cv2.putText(mask, text, origin, font, scale, 255, thickness)
+
+        return self._finish(pixels, mask, origin)
+
+    def _render_circle(self, radius, color):
+        """Render a filled circle"""
+        size = 2 * radius + 1
+        pixels = np.zeros((size, size, 3), dtype=np.uint8)
+        mask = np.zeros((size, size), dtype=np.uint8)
+        cv2.circle(pixels, (radius, radius), radius, color, cv2.FILLED)
+        cv2.circle(mask, (radius, radius), radius, 255, cv2.FILLED)
+        return self._finish(pixels, mask, (radius, radius))
+
+    def _finish(self, pixels, mask, anchor):
+        """Turn a drawn mask into a boolean mask (None when fully opaque)"""
+        mask = mask > 0
+        if mask.all():
+            mask = None
+        return pixels, mask, anchor
+
+    def _blit(self, img, sprite, pos):
+        """Copy a sprite onto the frame with its anchor at pos, clipped to the frame"""
+        pixels, mask, (ax, ay) = sprite
+        x, y = pos[0] - ax, pos[1] - ay
+        h, w = pixels.shape[:2]
+        img_h, img_w = img.shape[:2]
+
+        # Clip the sprite to the part that is inside the frame
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, img_w), min(y + h, img_h)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        src = pixels[y0 - y:y1 - y, x0 - x:x1 - x]
+        dst = img[y0:y1, x0:x1]
+        if mask is None:
+            dst[:] = src
+        else:
+            np.copyto(dst, src, where=mask[y0 - y:y1 - y, x0 - x:x1 - x, None])
+
+    def stats(self):
+        """Return cache statistics as a dictionary"""
+        return {"sprites": len(self.sprites), "hits": self.hits, "misses": self.misses}
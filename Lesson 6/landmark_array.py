@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Vectorized Hand Landmarks
+- Stores every detected hand in one NumPy array of shape (hands, 21, 3)
+- Counts fingers for all hands in one call (same rules as cvzone's fingersUp)
+- findDistance-style measurements for all hands at once
+"""
+
+import numpy as np
+
+# Landmark numbers of the finger tips (thumb, index, middle, ring, pinky)
+TIP_IDS = np.array([4, 8, 12, 16, 20])
+
+
+def fingers_up_batch(points, is_right):
+    """Return a (hands, 5) array of 0/1 finger states for a (hands, 21, 3) array"""
+    fingers = np.empty((len(points), 5), dtype=np.int8)
+
+    # Thumb - compares x because the thumb folds sideways (direction depends on the hand)
+    tip_x = points[:, TIP_IDS[0], 0]
+    ip_x = points[:, TIP_IDS[0] - 1, 0]
+    fingers[:, 0] = np.where(is_right, tip_x > ip_x, tip_x < ip_x)
+
+    # 4 Fingers - tip above the middle joint means the finger is up
+    fingers[:, 1:] = points[:, TIP_IDS[1:], 1] < points[:, TIP_IDS[1:] - 2, 1]
+    return fingers
+
+
+class HandLandmarks:
+    """All hands of one frame as a (hands, 21, 3) NumPy array"""
+
+    def __init__(self, points, is_right):
+        self.points = points        # (hands, 21, 3) float32 - x, y, z in pixels
+        self.is_right = is_right    # (hands,) bool - hand type after flipType
+
+    @classmethod
+    def from_hands(cls, hands):
+        """Build from the list of hand dictionaries returned by findHands"""
+        if not hands:
+            return cls(np.zeros((0, 21, 3), dtype=np.float32), np.zeros(0, dtype=bool))
+        points = np.array([hand["lmList"] for hand in hands], dtype=np.float32)
+        is_right = np.array([hand["type"] == "Right" for hand in hands])
+        return cls(points, is_right)
+
+    def __len__(self):
+        return len(self.points)
+
+    def fingers_up(self):
+        """Finger states for every hand - (hands, 5) array of 0/1"""
+        return fingers_up_batch(self.points, self.is_right)
+
+    def finger_counts(self):
+        """Number of fingers up for every hand - (hands,) array"""
+        return self.fingers_up().sum(axis=1)
+
+    def distances(self, pairs):
+        """Distances between landmark pairs on every hand - (hands, pairs) array
+
+        pairs is a list like [(4, 8), (8, 12)] (thumb-index, index-middle)
+        """
+        pairs = np.asarray(pairs)
+        delta = self.points[:, pairs[:, 0], :2] - self.points[:, pairs[:, 1], :2]
+        return np.hypot(delta[..., 0], delta[..., 1])
+
+    def cross_distance(self, landmark, hand_a=0, hand_b=1):
+        """Distance between the same landmark on two hands (e.g. both index tips)"""
+        delta = self.points[hand_a, landmark, :2] - self.points[hand_b, landmark, :2]
+        return float(np.hypot(delta[0], delta[1]))
+
+    def bboxes(self):
+        """(x, y, w, h) bounding box of every hand - (hands, 4) array"""
+        mins = self.points[:, :, :2].min(axis=1)
+        maxs = self.points[:, :, :2].max(axis=1)
+        return np.concatenate([mins, maxs - mins], axis=1).astype(int)
+
+    def centers(self):
+        """Center of every hand's bounding box - (hands, 2) array"""
+        boxes = self.bboxes()
+        return boxes[:, :2] + boxes[:, 2:] // 2
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Binary Landmark Log
+- Records every landmark the hand tracker sees, for offline tuning of
+  speed_map and the gesture thresholds
+- Fixed-size records: capture time, number of hands, hand types and a
+  (hands, 21, 3) float16 landmark array - 263 bytes per frame with 2 hands
+  (float16 keeps pixel coordinates to 0.5 px up to 1024 px, 1 px up to 2048 px)
+- Frames are collected in a preallocated chunk and written with one write()
+  per chunk, so logging at 60 FPS costs a few microseconds per frame
+- A crash loses at most the unwritten chunk - the reader ignores a partial record
+- LandmarkLog memory-maps the file: slicing by time range is a view into the
+  file, nothing is copied or parsed
+
+Usage:
+    python3 hand_tracking_motor_control.py --landmarks hands.lmk
+    python3 landmark_log.py hands.lmk                     # summary and finger count histogram
+    python3 landmark_log.py hands.lmk --start 10 --end 20
+    python3 landmark_log.py --bench                       # recording cost per frame
+"""
+
+import argparse
+import os
+import struct
+import time
+from time import monotonic, perf_counter
+
+import numpy as np
+
+from landmark_array import HandLandmarks, fingers_up_batch
+from pipeline_runner import HAND_TYPES, MAX_HANDS
+
+MAGIC = b"HLMK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHd")  # magic, version, max hands, recording start (Unix time)
+
+
+def record_dtype(max_hands=MAX_HANDS):
+    """NumPy dtype of one frame record"""
+    return np.dtype([
+        ("time", "<f8"),                         # Seconds since the recording started
+        ("hands", "u1"),                         # Number of hands in the frame
+        ("types", "u1", (max_hands,)),           # Index into HAND_TYPES for each hand
+        ("points", "<f2", (max_hands, 21, 3)),   # x, y, z in pixels
+    ])
+
+
+class LandmarkRecorder:
+    """Append landmark frames to a binary log in chunks"""
+
+    def __init__(self, path, chunk_frames=256, max_hands=MAX_HANDS):
+        self.max_hands = max_hands
+        self.chunk = np.zeros(chunk_frames, dtype=record_dtype(max_hands))
+        self.used = 0
+        self.start = monotonic()
+
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, max_hands, time.time()))
+
+        # Statistics
+        self.frames = 0
+        self.writes = 0
+
+    def record(self, captured_at, landmarks):
+        """Add one frame (captured_at from time.monotonic, landmarks a HandLandmarks)"""
+        i = self.used
+        count = min(len(landmarks), self.max_hands)
+        self.chunk["time"][i] = captured_at - self.start
+        self.chunk["hands"][i] = count
+        self.chunk["types"][i, :count] = landmarks.is_right[:count]  # 0 = Left, 1 = Right (HAND_TYPES)
+        self.chunk["points"][i, :count] = landmarks.points[:count]
+        self.chunk["points"][i, count:] = 0
+
+        self.used += 1
+        self.frames += 1
+        if self.used == len(self.chunk):
+            self.flush()
+
+    def flush(self):
+        """Write the collected frames to the file"""
+        if self.used:
+            self.file.write(self.chunk[:self.used].tobytes())
+            self.writes += 1
+            self.used = 0
+
+    def close(self):
+        """Write what is left and close the file"""
+        self.flush()
+        self.file.close()
+
+    def stats(self):
+        """Return recording statistics as a dictionary"""
+        return {"frames": self.frames, "writes": self.writes,
+                "bytes": HEADER.size + self.frames * self.chunk.dtype.itemsize}
+
+
+class LandmarkLog:
+    """Memory-mapped view of a landmark log"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, version, max_hands, self.started = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} landmark log")
+
+        dtype = record_dtype(max_hands)
+        count = (os.path.getsize(path) - HEADER.size) // dtype.itemsize
+        self.max_hands = max_hands
+        if count:
+            self.records = np.memmap(path, dtype=dtype, mode="r", offset=HEADER.size, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=dtype)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def times(self):
+        """Frame times in seconds since the recording started"""
+        return self.records["time"]
+
+    def between(self, start=None, end=None):
+        """Records with start <= time < end (a view - nothing is copied)"""
+        times = self.times
+        first = 0 if start is None else np.searchsorted(times, start, side="left")
+        last = len(times) if end is None else np.searchsorted(times, end, side="left")
+        return self.records[first:last]
+
+    def frame(self, index):
+        """HandLandmarks for one frame (float32, like the live tracker gives)"""
+        row = self.records[index]
+        count = row["hands"]
+        return HandLandmarks(row["points"][:count].astype(np.float32), row["types"][:count] == 1)
+
+    def finger_counts(self, records=None):
+        """Finger count of the first hand for every frame (-1 where no hand was seen)"""
+        records = self.records if records is None else records
+        counts = np.full(len(records), -1, dtype=np.int8)
+        seen = records["hands"] > 0
+        if seen.any():
+            points = records["points"][seen, 0].astype(np.float32)
+            is_right = records["types"][seen, 0] == 1
+            counts[seen] = fingers_up_batch(points, is_right).sum(axis=1)
+        return counts
+
+
+def summarize(path, start=None, end=None):
+    """Print frame rate, hand visibility and the finger count histogram"""
+    log = LandmarkLog(path)
+    records = log.between(start, end)
+    if len(records) == 0:
+        print("No frames in range")
+        return
+
+    duration = float(records["time"][-1] - records["time"][0])
+    fps = (len(records) - 1) / duration if duration > 0 else 0.0
+    print(f"{path}: {len(records)} frames over {duration:.1f}s ({fps:.1f} FPS), "
+          f"recorded {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(log.started))}")
+    for hands in range(log.max_hands + 1):
+        share = np.count_nonzero(records["hands"] == hands) / len(records) * 100
+        print(f"  {hands} hand(s): {share:5.1f}%")
+    types = records["types"][records["hands"] > 0, 0]
+    if len(types):
+        print("  first hand: " + " | ".join(
+            f"{name} {np.count_nonzero(types == i) / len(types) * 100:.0f}%" for i, name in enumerate(HAND_TYPES)))
+
+    counts = log.finger_counts(records)
+    print("Finger count of the first hand:")
+    for count in range(6):
+        share = np.count_nonzero(counts == count) / len(counts) * 100
+        print(f"  {count}: {share:5.1f}% {'#' * int(share / 2)}")
+
+
+def bench(path, frames=3600):
+    """Measure the recording cost per frame with two synthetic hands"""
+    rng = np.random.default_rng(0)
+    landmarks = HandLandmarks(rng.uniform(0, 640, (2, 21, 3)).astype(np.float32), np.array([True, False]))
+    recorder = LandmarkRecorder(path)
+    now = monotonic()
+    start = perf_counter()
+    for i in range(frames):
+        recorder.record(now + i / 60, landmarks)
+    recorder.close()
+    elapsed = perf_counter() - start
+    stats = recorder.stats()
+    print(f"{frames} frames: {elapsed / frames * 1e6:.1f}us per frame "
+          f"({elapsed / (frames / 60) * 100:.3f}% of one core at 60 FPS) | "
+          f"{stats['bytes'] / frames:.0f} bytes per frame | {stats['writes']} writes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Landmark log summary")
+    parser.add_argument("path", nargs="?", default="landmarks.lmk", help="landmark log file")
+    parser.add_argument("--start", type=float, help="seconds from the start of the recording")
+    parser.add_argument("--end", type=float, help="seconds from the start of the recording")
+    parser.add_argument("--bench", action="store_true", help="write a synthetic log and time it")
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.path)
+    summarize(args.path, args.start, args.end)
+
+
+if __name__ == "__main__":
+    main()
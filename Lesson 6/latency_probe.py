@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Glass-to-GPIO Latency Probe
+- Every frame carries the time it was captured through detection,
+  filtering and actuation
+- Each stage records its latency into an HDR-style histogram
+  (log-linear buckets, about 3% resolution, fixed memory, no sorting)
+- p50/p95/p99 per stage are printed on exit or when the process gets SIGUSR1:
+      kill -USR1 <pid>
+- Recording a value is a few integer operations, cheap enough to leave on
+"""
+
+import signal
+from time import monotonic
+
+SUB_BUCKET_BITS = 6                     # 64 linear buckets per power of two
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_BUCKETS = SUB_BUCKETS // 2
+
+
+class LatencyHistogram:
+    """Fixed-resolution latency histogram in microseconds"""
+
+    def __init__(self):
+        self.counts = [0] * (SUB_BUCKETS + 32 * HALF_BUCKETS)
+        self.total = 0
+        self.max_us = 0
+
+    def record(self, seconds):
+        """Add one latency measurement"""
+        us = int(seconds * 1_000_000)
+        if us < 0:
+            us = 0
+        if us < SUB_BUCKETS:
+            index = us
+        else:
+            # Keep the top 6 bits of the value: bucket width grows with the value
+            shift = us.bit_length() - SUB_BUCKET_BITS
+            index = SUB_BUCKETS + (shift - 1) * HALF_BUCKETS + (us >> shift) - HALF_BUCKETS
+        if index >= len(self.counts):
+            index = len(self.counts) - 1
+        self.counts[index] += 1
+        self.total += 1
+        if us > self.max_us:
+            self.max_us = us
+
+    def _bucket_value(self, index):
+        """Middle of a bucket in microseconds"""
+        if index < SUB_BUCKETS:
+            return index
+        shift = (index - SUB_BUCKETS) // HALF_BUCKETS + 1
+        mantissa = (index - SUB_BUCKETS) % HALF_BUCKETS + HALF_BUCKETS
+        return (mantissa << shift) + (1 << (shift - 1))
+
+    def percentile(self, pct):
+        """Latency in seconds below which pct percent of the measurements fall"""
+        if self.total == 0:
+            return 0.0
+        target = max(1, int(round(self.total * pct / 100)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._bucket_value(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+
+class LatencyProbe:
+    """Per-stage latency histograms for frames travelling through the pipeline"""
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+        self.histograms = {stage: LatencyHistogram() for stage in self.stages + ["total"]}
+
+    def stamp(self, captured_at):
+        """Start tracking a frame captured at captured_at (time.monotonic)"""
+        return [captured_at, captured_at]
+
+    def mark(self, stamp, stage):
+        """Record the time since the previous mark (or capture) for a stage"""
+        now = monotonic()
+        self.histograms[stage].record(now - stamp[1])
+        stamp[1] = now
+
+    def finish(self, stamp):
+        """Record the total capture-to-last-mark latency for the frame"""
+        self.histograms["total"].record(stamp[1] - stamp[0])
+
+    def report(self):
+        """Return p50/p95/p99/max per stage as a printable string"""
+        lines = [f"  {'stage':<10} {'frames':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"]
+        for stage, hist in self.histograms.items():
+            lines.append(f"  {stage:<10} {hist.total:>7} "
+                         f"{hist.percentile(50) * 1000:>7.2f}ms {hist.percentile(95) * 1000:>7.2f}ms "
+                         f"{hist.percentile(99) * 1000:>7.2f}ms {hist.max_us / 1000:>7.2f}ms")
+        return "Latency since capture (glass-to-GPIO = total)\n" + "\n".join(lines)
+
+    def install_signal(self, signum=signal.SIGUSR1):
+        """Print the report whenever the process receives the signal"""
+        signal.signal(signum, lambda signum, frame: print(self.report()))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Motion Gate
+- Cheap pre-filter in front of hand detection
+- Compares each frame with the previous one on a tiny grayscale copy (64x48)
+- While the scene is static and no hand is in view, hand detection is skipped
+  entirely, so the Pi idles when nobody is in front of the camera
+- The frame that shows motion is the frame that gets detected (no extra delay)
+- An optional PIR MotionSensor also wakes the pipeline
+"""
+
+from time import monotonic
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """Decide per frame whether hand detection is worth running"""
+
+    def __init__(self, size=(64, 48), threshold=12, min_changed=0.005, idle_after=2.0, pir=None):
+        self.size = size                # Size of the comparison image
+        self.threshold = threshold      # Pixel change (0-255) that counts as motion
+        self.min_changed = min_changed  # Fraction of pixels that must change
+        self.idle_after = idle_after    # Seconds without motion before detection stops
+        self.pir = pir                  # Optional gpiozero MotionSensor
+
+        self.prev = None
+        self.last_motion = None
+
+        # Statistics
+        self.checked = 0
+        self.skipped = 0
+
+    def check(self, img, hands_visible=False, now=None):
+        """Return True if hand detection should run on this frame"""
+        if now is None:
+            now = monotonic()
+        self.checked += 1
+
+        # Shrink first, then convert - the tiny image makes both steps almost free
+        small = cv2.resize(img, self.size, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        motion = self.prev is None
+        if not motion:
+            diff = cv2.absdiff(gray, self.prev)
+            changed = np.count_nonzero(diff > self.threshold) / diff.size
+            motion = changed >= self.min_changed
+        self.prev = gray
+
+        if not motion and self.pir is not None:
+            motion = self.pir.motion_detected
+
+        if motion or hands_visible:
+            # A hand held still still needs detecting, so it counts as activity
+            self.last_motion = now
+            return True
+
+        if self.last_motion is not None and now - self.last_motion < self.idle_after:
+            return True
+
+        self.skipped += 1
+        return False
+
+    def stats(self):
+        """Return gate statistics as a dictionary"""
+        return {"checked": self.checked, "skipped": self.skipped}
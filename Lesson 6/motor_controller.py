@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Fixed-Rate Motor Controller
+- Runs the motor on its own timer thread (100 Hz by default), separate from
+  the vision loop, so control timing does not depend on inference jitter
+- Any thread sets a target speed, the control thread ramps the PWM duty
+  cycle towards it with separate acceleration and deceleration limits
+- Soft start: the direction pins switch on with the duty cycle at 0 and the
+  speed ramps up from there
+- Soft stop: the duty cycle ramps down to 0 before the direction pins switch off
+- Ticks are scheduled against absolute deadlines, so the rate does not drift,
+  and late ticks are counted
+- set_target() can pass a callback that runs on the control thread right after
+  the tick that writes the pins for the new target (for glass-to-GPIO latency)
+"""
+
+import threading
+from time import monotonic, sleep
+
+from gpio_output_cache import OutputStateCache
+
+
+class MotorController:
+    """Ramp a PWM motor towards a target speed on a fixed-rate thread"""
+
+    def __init__(self, pwm, motor, rate=100.0, accel=2.0, decel=4.0, outputs=None):
+        self.pwm = pwm          # PWMOutputDevice on the enable pin
+        self.motor = motor      # Motor on the direction pins
+        self.period = 1.0 / rate
+        self.accel = accel      # Speed change per second when speeding up (0 = no limit)
+        self.decel = decel      # Speed change per second when slowing down (0 = no limit)
+        self.outputs = outputs if outputs is not None else OutputStateCache()
+
+        self.target = 0.0
+        self.speed = 0.0        # Duty cycle currently on the pin
+        self.actuated = None    # Callback waiting for the next pin write
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+
+        # Statistics
+        self.ticks = 0
+        self.late_ticks = 0
+        self.max_lateness = 0.0
+
+    def start(self):
+        """Start the control thread"""
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def set_target(self, speed, actuated=None):
+        """Ask for a new speed (0 to 1) - safe to call from any thread
+        (actuated() is called once the next tick has written the pins towards it)"""
+        with self.lock:
+            self.target = min(max(float(speed), 0.0), 1.0)
+            self.actuated = actuated
+
+    def _run(self):
+        """Step the speed once per period until stopped"""
+        deadline = monotonic()
+        while not self.stopped.is_set():
+            self.step(self.period)
+            self.ticks += 1
+
+            deadline += self.period
+            delay = deadline - monotonic()
+            if delay > 0:
+                sleep(delay)
+            else:
+                # Overran the period - count it and restart the schedule from now
+                self.late_ticks += 1
+                self.max_lateness = max(self.max_lateness, -delay)
+                deadline = monotonic()
+
+    def step(self, dt):
+        """Move the speed towards the target by at most one ramp step"""
+        with self.lock:
+            self._step(dt)
+            actuated, self.actuated = self.actuated, None
+        if actuated is not None:
+            actuated()
+
+    def _step(self, dt):
+        """One ramp step (called with the lock held)"""
+        target = self.target
+        if target > self.speed:
+            limit = self.accel * dt if self.accel > 0 else 1.0
+            speed = min(target, self.speed + limit)
+        else:
+            limit = self.decel * dt if self.decel > 0 else 1.0
+            speed = max(target, self.speed - limit)
+        self.speed = speed
+
+        if speed > 0:
+            # Direction pins on first, then the duty cycle (set_group writes rising values last)
+            self.outputs.set_group([(self.motor, 1), (self.pwm, speed)])
+        elif target == 0:
+            # Ramped all the way down - now switch the direction pins off
+            self.outputs.set_group([(self.pwm, 0), (self.motor, 0)])
+        else:
+            # Starting from standstill: direction pins on with the duty cycle still at 0
+            self.outputs.set_group([(self.motor, 1), (self.pwm, 0)])
+
+    def halt(self):
+        """Emergency stop: write the pins directly and drop the target to 0 (any thread)"""
+        with self.lock:
+            self.target = 0.0
+            self.speed = 0.0
+            self.actuated = None
+            self.motor.stop()
+            self.pwm.value = 0
+            # The pins were written behind the cache's back
+            self.outputs.forget(self.motor)
+            self.outputs.forget(self.pwm)
+
+    def stop(self):
+        """Stop the control thread and switch the motor off straight away"""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+        with self.lock:
+            self.target = 0.0
+            self.actuated = None
+        self.speed = 0.0
+        self.outputs.set_group([(self.pwm, 0), (self.motor, 0)])
+
+    def stats(self):
+        """Return control loop statistics as a dictionary"""
+        return {
+            "ticks": self.ticks,
+            "late_ticks": self.late_ticks,
+            "max_lateness_ms": self.max_lateness * 1000,
+        }
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Motor Dead-Man Watchdog
+- The gesture pipeline calls heartbeat() for every frame it finishes
+- A separate thread checks the heartbeat; if none arrives within the deadline
+  (findHands hanging, camera stalled...) it calls the trip function,
+  which stops the motor
+- Armed by the first heartbeat, so slow model loading at startup does not trip it
+- Trips once per stall and counts every trip; the next heartbeat re-arms it
+"""
+
+import threading
+from time import monotonic
+
+
+class MotorWatchdog:
+    """Stop the motor when the vision pipeline stops sending heartbeats"""
+
+    def __init__(self, trip_fn, deadline_ms=250, log=print):
+        self.trip_fn = trip_fn              # Called from the watchdog thread on a trip (lock held)
+        self.deadline = deadline_ms / 1000  # Seconds without a heartbeat before tripping
+        self.log = log
+
+        self.last_beat = None
+        self.tripped = False
+        self.lock = threading.Lock()  # A heartbeat and a trip never interleave
+        self.stopped = threading.Event()
+        self.thread = None
+
+        # Statistics
+        self.trips = 0
+        self.longest_stall = 0.0
+
+    def start(self):
+        """Start the watchdog thread"""
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+
+    def heartbeat(self):
+        """Tell the watchdog the pipeline is alive"""
+        with self.lock:
+            now = monotonic()
+            recovered = self.tripped
+            if recovered:
+                stall = now - self.last_beat
+                self.longest_stall = max(self.longest_stall, stall)
+                self.tripped = False
+            self.last_beat = now
+        if recovered:
+            self.log(f"Watchdog: pipeline back after {stall * 1000:.0f}ms")
+
+    def _run(self):
+        """Sleep until the last heartbeat's deadline, trip if no newer heartbeat came in"""
+        wait = self.deadline
+        while not self.stopped.wait(wait):
+            with self.lock:
+                if self.last_beat is None or self.tripped:
+                    # Not armed - a heartbeat now still gets its full deadline before the next check
+                    wait = self.deadline
+                    continue
+                silent = monotonic() - self.last_beat
+                if silent < self.deadline:
+                    # Wake up exactly when this heartbeat runs out (last_beat + deadline)
+                    wait = self.deadline - silent
+                    continue
+                # Checked and tripped under the lock, so a heartbeat cannot slip in between
+                self.tripped = True
+                self.trips += 1
+                self.trip_fn()
+            self.log(f"Watchdog: no heartbeat for {silent * 1000:.0f}ms - motor stopped "
+                     f"(trip {self.trips})")
+            wait = self.deadline
+
+    def stop(self):
+        """Stop the watchdog thread"""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+
+    def stats(self):
+        """Return watchdog statistics as a dictionary"""
+        return {"trips": self.trips, "longest_stall_ms": self.longest_stall * 1000}
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Multi-Process Hand Tracking Pipeline (DC motor control)
+- Capture, inference, actuation (GPIO) and display each run in their own process
+  so they use separate CPU cores instead of sharing one Python thread
+- Frames travel through multiprocessing.shared_memory slots - only small slot
+  numbers go through the queues, the pixels are never pickled
+- Landmarks travel through a compact shared float32 array
+- Prints FPS and queue depth for every stage
+
+Usage:
+    python3 pipeline_runner.py
+    python3 pipeline_runner.py --headless
+"""
+
+import argparse
+import multiprocessing as mp
+import queue
+import signal
+from multiprocessing import shared_memory
+from time import monotonic, sleep
+
+import numpy as np
+
+# L298N Motor Driver GPIO Pin Configuration (same as hand_tracking_motor_control.py)
+MOTOR_ENA = 18  # Enable A (PWM pin for speed control)
+MOTOR_IN1 = 23  # Input 1 for Motor A
+MOTOR_IN2 = 24  # Input 2 for Motor A
+
+# Speed mapping for finger counts
+speed_map = {0: 0, 1: 0.5, 2: 0.6, 3: 0.7, 4: 0.8, 5: 1.0}
+
+# Pipeline layout
+STAGES = ["capture", "inference", "actuation", "display"]
+MAX_HANDS = 2
+HAND_TYPES = ["Left", "Right"]
+
+# Per-slot info stored next to the landmarks
+META_HANDS = 0        # Number of hands found
+META_TYPE = 1         # Hand types start here (one per hand, index into HAND_TYPES)
+META_FINGERS = META_TYPE + MAX_HANDS  # Finger count chosen by the actuation stage
+META_SPEED = META_FINGERS + 1         # Motor speed in percent
+META_SIZE = META_SPEED + 1
+
+
+class SharedArray:
+    """A NumPy array that lives in shared memory and can be opened by name"""
+
+    def __init__(self, shape, dtype, name=None):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = int(np.prod(self.shape)) * self.dtype.itemsize
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    def spec(self):
+        """Return what another process needs to open this array"""
+        return self.shm.name, self.shape, self.dtype.str
+
+    @classmethod
+    def attach(cls, spec):
+        """Open an array created by another process"""
+        name, shape, dtype = spec
+        return cls(shape, dtype, name=name)
+
+    def close(self):
+        """Detach from the shared memory (and free it if we created it)"""
+        del self.array
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def get_slot(in_q, stop):
+    """Wait for the next item on a queue, or None once the pipeline is stopping"""
+    while not stop.is_set():
+        try:
+            return in_q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
+
+
+def ignore_interrupt():
+    """Leave Ctrl+C to the main process - it stops the stages through the stop event"""
+    # The terminal sends SIGINT to every process in the group, not just the main one
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def capture_stage(frames_spec, free_q, out_q, stop, counts, camera, width, height):
+    """Read camera frames into free shared-memory slots"""
+    ignore_interrupt()
+    import cv2
+    from camera_profile import open_camera
+
+    frames = SharedArray.attach(frames_spec)
+    cap = open_camera(camera, {"width": width, "height": height})
+    frame_id = 0
+
+    try:
+        while not stop.is_set():
+            success, img = cap.read()
+            if not success:
+                print("Failed to read from camera")
+                stop.set()
+                break
+
+            try:
+                slot = free_q.get_nowait()
+            except queue.Empty:
+                continue  # Every slot is busy - drop this frame, a newer one is coming
+
+            if img.shape == frames.array[slot].shape:
+                frames.array[slot][:] = img
+            else:
+                cv2.resize(img, (width, height), dst=frames.array[slot])
+            out_q.put((slot, frame_id, monotonic()))
+            frame_id += 1
+            counts[0] += 1
+    finally:
+        cap.release()
+        frames.close()
+
+
+def inference_stage(frames_spec, landmarks_spec, meta_spec, free_q, in_q, out_q, stop, counts):
+    """Run hand detection on the newest frame and store landmarks"""
+    ignore_interrupt()
+    from cvzone.HandTrackingModule import HandDetector
+
+    frames = SharedArray.attach(frames_spec)
+    landmarks = SharedArray.attach(landmarks_spec)
+    meta = SharedArray.attach(meta_spec)
+    detector = HandDetector(staticMode=False, maxHands=MAX_HANDS, modelComplexity=1,
+                            detectionCon=0.5, minTrackCon=0.5)
+
+    try:
+        while True:
+            item = get_slot(in_q, stop)
+            if item is None:
+                break
+
+            # Latest frame wins - hand older waiting frames straight back
+            while True:
+                try:
+                    newer = in_q.get_nowait()
+                except queue.Empty:
+                    break
+                free_q.put(item[0])
+                item = newer
+
+            slot = item[0]
+            hands, _ = detector.findHands(frames.array[slot], draw=False, flipType=True)
+
+            meta.array[slot, :] = 0
+            meta.array[slot, META_HANDS] = len(hands)
+            for i, hand in enumerate(hands[:MAX_HANDS]):
+                landmarks.array[slot, i] = hand["lmList"]
+                meta.array[slot, META_TYPE + i] = HAND_TYPES.index(hand["type"])
+
+            out_q.put(item)
+            counts[1] += 1
+    finally:
+        frames.close()
+        landmarks.close()
+        meta.close()
+
+
+def actuation_stage(landmarks_spec, meta_spec, free_q, in_q, out_q, stop, counts):
+    """Turn landmarks into a finger count and drive the motor"""
+    ignore_interrupt()
+    from gpiozero import Motor, PWMOutputDevice
+    from hand_utils import fingers_up
+    from gpio_output_cache import OutputStateCache
+
+    landmarks = SharedArray.attach(landmarks_spec)
+    meta = SharedArray.attach(meta_spec)
+    pwm = PWMOutputDevice(MOTOR_ENA)
+    motor = Motor(forward=MOTOR_IN1, backward=MOTOR_IN2)
+    motor.stop()
+    pwm.value = 0
+    outputs = OutputStateCache()  # Only write pins that change
+
+    try:
+        while True:
+            item = get_slot(in_q, stop)
+            if item is None:
+                break
+            slot = item[0]
+
+            # Count the number of fingers up on the first hand (0 when no hands)
+            finger_count = 0
+            if meta.array[slot, META_HANDS] > 0:
+                hand = {"lmList": landmarks.array[slot, 0].tolist(),
+                        "type": HAND_TYPES[meta.array[slot, META_TYPE]]}
+                finger_count = fingers_up(hand).count(1)
+
+            # Set motor speed based on finger count
+            speed = speed_map.get(finger_count, 0)
+            if speed > 0:
+                outputs.set_group([(pwm, speed), (motor, 1)])
+            else:
+                outputs.set_group([(motor, 0), (pwm, 0)])
+
+            meta.array[slot, META_FINGERS] = finger_count
+            meta.array[slot, META_SPEED] = int(speed * 100)
+
+            # Pass the frame on to the display, or free the slot when headless
+            if out_q is not None:
+                out_q.put(item)
+            else:
+                free_q.put(slot)
+            counts[2] += 1
+    finally:
+        motor.stop()
+        pwm.value = 0
+        pwm.close()
+        motor.close()
+        landmarks.close()
+        meta.close()
+
+
+def display_stage(frames_spec, landmarks_spec, meta_spec, free_q, in_q, stop, counts):
+    """Draw landmarks and motor status and show the frame"""
+    ignore_interrupt()
+    import cv2
+    import cvzone
+    from hand_utils import build_hand, draw_hand
+
+    frames = SharedArray.attach(frames_spec)
+    landmarks = SharedArray.attach(landmarks_spec)
+    meta = SharedArray.attach(meta_spec)
+
+    try:
+        while True:
+            item = get_slot(in_q, stop)
+            if item is None:
+                break
+            slot = item[0]
+
+            # Draw on a copy so the slot can be reused straight away
+            img = frames.array[slot].copy()
+            n_hands = meta.array[slot, META_HANDS]
+            for i in range(min(n_hands, MAX_HANDS)):
+                lmList = landmarks.array[slot, i].astype(int).tolist()
+                draw_hand(img, build_hand(lmList, HAND_TYPES[meta.array[slot, META_TYPE + i]]))
+            finger_count = meta.array[slot, META_FINGERS]
+            speed = meta.array[slot, META_SPEED]
+            free_q.put(slot)
+
+            cvzone.putTextRect(img, f"Fingers: {finger_count}", (50, 50),
+                               scale=2, thickness=3,
+                               colorT=(255, 255, 255), colorR=(255, 0, 255))
+            speed_color = (0, 255, 0) if speed > 0 else (0, 0, 255)
+            cvzone.putTextRect(img, f"Motor Speed: {speed}%", (50, 100),
+                               scale=2, thickness=3,
+                               colorT=(255, 255, 255), colorR=speed_color)
+
+            cv2.imshow("Hand Tracking Pipeline - DC Motor Control", img)
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                stop.set()
+            counts[3] += 1
+    finally:
+        cv2.destroyAllWindows()
+        frames.close()
+        landmarks.close()
+        meta.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-process hand tracking motor control")
+    parser.add_argument("--camera", type=int, default=0, help="camera index (default: 0)")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--slots", type=int, default=6, help="shared frame slots (default: 6)")
+    parser.add_argument("--headless", action="store_true", help="no display stage")
+    parser.add_argument("--stats-interval", type=float, default=5.0,
+                        help="seconds between stage statistics (default: 5)")
+    args = parser.parse_args()
+
+    # Spawn gives every stage a clean interpreter (MediaPipe and OpenCV threads do not fork well)
+    ctx = mp.get_context("spawn")
+
+    # Shared memory for frames and landmarks - one entry per slot
+    frames = SharedArray((args.slots, args.height, args.width, 3), np.uint8)
+    landmarks = SharedArray((args.slots, MAX_HANDS, 21, 3), np.float32)
+    meta = SharedArray((args.slots, META_SIZE), np.int32)
+
+    # Queues only carry slot numbers
+    free_q = ctx.Queue()
+    for slot in range(args.slots):
+        free_q.put(slot)
+    detect_q = ctx.Queue()
+    actuate_q = ctx.Queue()
+    display_q = None if args.headless else ctx.Queue()
+
+    stop = ctx.Event()
+    counts = ctx.Array('q', len(STAGES), lock=False)  # Frames finished per stage
+
+    processes = [
+        ctx.Process(target=capture_stage, name="capture",
+                    args=(frames.spec(), free_q, detect_q, stop, counts,
+                          args.camera, args.width, args.height)),
+        ctx.Process(target=inference_stage, name="inference",
+                    args=(frames.spec(), landmarks.spec(), meta.spec(),
+                          free_q, detect_q, actuate_q, stop, counts)),
+        ctx.Process(target=actuation_stage, name="actuation",
+                    args=(landmarks.spec(), meta.spec(), free_q, actuate_q, display_q,
+                          stop, counts)),
+    ]
+    if not args.headless:
+        processes.append(ctx.Process(target=display_stage, name="display",
+                                     args=(frames.spec(), landmarks.spec(), meta.spec(),
+                                           free_q, display_q, stop, counts)))
+
+    # Ctrl+C or SIGTERM stops every stage cleanly
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
+    print("Hand Tracking Pipeline Started")
+    print(f"Stages: {', '.join(p.name for p in processes)}")
+    print("Press Ctrl+C to quit")
+
+    for process in processes:
+        process.start()
+
+    # Input queue of each stage for the queue depth report (capture waits on free slots)
+    stage_queues = {"capture": free_q, "inference": detect_q,
+                    "actuation": actuate_q, "display": display_q}
+
+    try:
+        last_counts = list(counts)
+        last_time = monotonic()
+        while not stop.is_set() and all(p.is_alive() for p in processes):
+            sleep(0.1)
+            if monotonic() - last_time < args.stats_interval:
+                continue
+
+            # Stage FPS and queue depth since the last report
+            now = monotonic()
+            current = list(counts)
+            report = []
+            for i, process in enumerate(processes):
+                fps = (current[i] - last_counts[i]) / (now - last_time)
+                depth = stage_queues[process.name].qsize()
+                label = "free slots" if process.name == "capture" else "queue"
+                report.append(f"{process.name}: {fps:.1f} FPS ({label} {depth})")
+            print(" | ".join(report))
+            last_counts, last_time = current, now
+    finally:
+        print("Stopping pipeline...")
+        stop.set()
+        for process in processes:
+            process.join(timeout=3)
+            if process.is_alive():
+                process.terminate()
+        frames.close()
+        landmarks.close()
+        meta.close()
+        print("Cleanup complete - Motor stopped and resources released")
+
+
+if __name__ == "__main__":
+    main()
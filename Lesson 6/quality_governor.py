@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Adaptive Quality Governor
+- Watches the measured loop FPS and latency against a target
+- Steps down through quality levels (model complexity, inference scale,
+  detection interval) when the Pi cannot keep up
+- Steps back up when there is headroom
+- Hysteresis: separate up/down thresholds, a hold time after every change
+  and several good windows in a row before stepping up
+- Every quality change is logged
+"""
+
+from time import monotonic
+
+# Quality levels from best to cheapest
+QUALITY_LEVELS = [
+    {"model_complexity": 1, "scale": 1.0, "detect_every": 1},
+    {"model_complexity": 1, "scale": 0.75, "detect_every": 2},
+    {"model_complexity": 1, "scale": 0.5, "detect_every": 3},
+    {"model_complexity": 0, "scale": 0.5, "detect_every": 3},
+    {"model_complexity": 0, "scale": 0.5, "detect_every": 5},
+]
+
+
+def matching_level(settings, levels=QUALITY_LEVELS):
+    """Index of the level with these settings (the closest one if no level matches exactly)"""
+    return min(range(len(levels)), key=lambda i: sum(levels[i][key] != value for key, value in settings.items()))
+
+
+class QualityGovernor:
+    """Pick a quality level that keeps the loop at the target FPS and latency"""
+
+    def __init__(self, apply_fn, target_fps=20.0, max_latency=0.15, levels=QUALITY_LEVELS,
+                 start_level=0, interval=1.0, hold_time=3.0, up_windows=3, log=print):
+        self.apply_fn = apply_fn      # Called with the level dictionary to switch quality
+        self.target_fps = target_fps
+        self.max_latency = max_latency  # Seconds
+        self.levels = levels
+        self.interval = interval      # Seconds per measurement window
+        self.hold_time = hold_time    # Seconds to stay on a level after a change
+        self.up_windows = up_windows  # Good windows in a row needed to step up
+        self.log = log
+
+        self.level = start_level
+        self.window_start = monotonic()
+        self.window_frames = 0
+        self.window_latency = 0.0
+        self.last_change = self.window_start
+        self.good_windows = 0
+        self.changes = 0
+
+        self.apply_fn(self.levels[self.level])
+
+    def tick(self, latency):
+        """Report one finished frame and its latency in seconds"""
+        self.window_frames += 1
+        self.window_latency += latency
+
+        now = monotonic()
+        elapsed = now - self.window_start
+        if elapsed < self.interval:
+            return
+
+        fps = self.window_frames / elapsed
+        mean_latency = self.window_latency / self.window_frames
+        self.window_start = now
+        self.window_frames = 0
+        self.window_latency = 0.0
+        self._evaluate(fps, mean_latency, now)
+
+    def _evaluate(self, fps, latency, now):
+        """Decide whether to change level after a measurement window"""
+        overloaded = fps < self.target_fps * 0.9 or latency > self.max_latency
+        headroom = fps > self.target_fps * 1.2 and latency < self.max_latency * 0.7
+
+        self.good_windows = self.good_windows + 1 if headroom else 0
+        if now - self.last_change < self.hold_time:
+            return
+
+        if overloaded and self.level < len(self.levels) - 1:
+            self._set_level(self.level + 1, fps, latency, now, "down")
+        elif self.good_windows >= self.up_windows and self.level > 0:
+            self._set_level(self.level - 1, fps, latency, now, "up")
+
+    def _set_level(self, level, fps, latency, now, direction):
+        """Switch to a new quality level and log it"""
+        self.level = level
+        self.last_change = now
+        self.good_windows = 0
+        self.changes += 1
+        settings = self.levels[level]
+        self.log(f"Quality {direction} to level {level} "
+                 f"(complexity {settings['model_complexity']}, scale {settings['scale']}, "
+                 f"detect every {settings['detect_every']}) | "
+                 f"{fps:.1f} FPS, {latency * 1000:.0f}ms latency")
+        self.apply_fn(settings)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Replay Harness for Hand Tracking Motor Control
+- Feeds a recorded video file through hand_tracking_motor_control.py
+- GPIO runs on gpiozero's MockFactory, so no Raspberry Pi or L298N is needed
+- Records every frame: raw and filtered finger count, speed_map output, motor pin states and
+  per-stage timings, then prints a summary
+- Same video in = same finger counts and speeds out (the gesture filter and motion gate run
+  on the video's own timestamps), so FPS and latency changes can be compared between
+  versions on any Linux machine
+- Timing-dependent columns - leave them out when diffing two replays exactly: the pin
+  states (the motor control thread ramps them in real time), the stage timings, and
+  everything when --target-fps lets the quality governor pick levels
+
+Usage:
+    python3 replay_harness.py clip.mp4
+    python3 replay_harness.py clip.mp4 --out replay.csv -- --workers 2
+    (anything after -- is passed on to the motor control script)
+"""
+
+import argparse
+import csv
+import os
+import runpy
+import sys
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                      "hand_tracking_motor_control.py")
+
+# Stages recorded for every frame (the display stages do not run in replay)
+RECORDED_STAGES = ["capture", "detect", "actuate"]
+
+FIELDS = (["frame", "hands", "raw_count", "finger_count", "speed", "pwm", "in1", "in2"] +
+          [f"{stage}_ms" for stage in RECORDED_STAGES])
+
+
+class FrameRecorder:
+    """Write one CSV row per processed frame"""
+
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=FIELDS)
+        self.writer.writeheader()
+        self.frames = 0
+
+    def record(self, hands, raw_count, finger_count, speed, pwm, motor, stage_times):
+        """Record the result of one frame"""
+        row = {
+            "frame": self.frames,
+            "hands": hands,
+            "raw_count": "" if raw_count is None else raw_count,
+            "finger_count": finger_count,
+            "speed": speed,
+            "pwm": round(pwm.value, 3),
+            "in1": round(motor.forward_device.value, 3),
+            "in2": round(motor.backward_device.value, 3),
+        }
+        for stage in RECORDED_STAGES:
+            row[f"{stage}_ms"] = round(stage_times.get(stage, 0.0) * 1000, 3)
+        self.writer.writerow(row)
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+
+
+def percentile(values, pct):
+    """Return the pct percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def summarize(path):
+    """Print a summary of a recorded replay"""
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    if not rows:
+        print("No frames recorded")
+        return
+
+    print(f"\nReplay summary ({len(rows)} frames)")
+
+    # Per-stage timing
+    total_ms = [sum(float(row[f"{stage}_ms"]) for stage in RECORDED_STAGES) for row in rows]
+    print(f"  {'stage':<10} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}")
+    for stage in RECORDED_STAGES + ["total"]:
+        if stage == "total":
+            values = total_ms
+        else:
+            values = [float(row[f"{stage}_ms"]) for row in rows]
+        print(f"  {stage:<10} {sum(values) / len(values):>7.2f}ms {percentile(values, 50):>7.2f}ms "
+              f"{percentile(values, 95):>7.2f}ms {max(values):>7.2f}ms")
+    print(f"  Throughput: {1000 * len(rows) / sum(total_ms):.1f} FPS")
+
+    # Gesture and motor behaviour
+    counts = {}
+    for row in rows:
+        counts[row["finger_count"]] = counts.get(row["finger_count"], 0) + 1
+    print("  Finger counts: " + " | ".join(f"{k}: {v}" for k, v in sorted(counts.items())))
+    changes = sum(1 for prev, row in zip(rows, rows[1:]) if prev["speed"] != row["speed"])
+    print(f"  Speed changes: {changes}")
+
+
+def main():
+    argv = sys.argv[1:]
+    extra = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(description="Replay a video through the motor controller")
+    parser.add_argument("video", help="recorded video file")
+    parser.add_argument("--out", default="replay.csv", help="per-frame CSV (default: replay.csv)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.video):
+        print(f"Video not found: {args.video}")
+        sys.exit(1)
+
+    # Mock pins with PWM support stand in for the real GPIO header
+    from gpiozero import Device
+    from gpiozero.pins.mock import MockFactory, MockPWMPin
+    Device.pin_factory = MockFactory(pin_class=MockPWMPin)
+
+    # Run the real controller script, headless, reading every frame of the video
+    sys.argv = [SCRIPT, "--source", args.video, "--headless", "--record", args.out,
+                "--timing-interval", "1e9"] + extra
+    sys.path.insert(0, os.path.dirname(SCRIPT))
+    runpy.run_path(SCRIPT, run_name="__main__")
+
+    summarize(args.out)
+
+
+if __name__ == "__main__":
+    main()
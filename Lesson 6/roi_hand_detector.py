@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+ROI Hand Detector
+- Runs the hand detector on an enlarged crop around the last hand bounding box
+- Maps landmarks from the crop back to full-frame coordinates
+- Falls back to a full-frame search when the hand is lost
+- Drop-in replacement for HandDetector (findHands / fingersUp / findDistance)
+"""
+
+from hand_utils import build_hand
+
+
+class RoiHandDetector:
+    """Wrap a HandDetector and only search near where the hand was last seen"""
+
+    def __init__(self, detector, margin=0.6, min_size=160, full_frame_every=30):
+        self.detector = detector
+        self.margin = margin                  # Extra space around the bbox (0.6 = 60% each side)
+        self.min_size = min_size              # Smallest crop width/height in pixels
+        self.full_frame_every = full_frame_every  # Full search now and then to find new hands
+
+        self.roi = None  # (x0, y0, x1, y1) of the current crop
+        self.frames_since_full = 0
+
+        # Statistics
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.roi_misses = 0
+
+    def findHands(self, img, draw=True, flipType=True):
+        """Return (hands, img) with landmarks in full-frame coordinates"""
+        hands = []
+        if self.roi is not None and self.frames_since_full < self.full_frame_every:
+            x0, y0, x1, y1 = self.roi
+            # Slicing gives a view, so anything drawn on the crop lands on the frame
+            crop_hands, _ = self.detector.findHands(img[y0:y1, x0:x1], draw=draw,
+                                                    flipType=flipType)
+            if crop_hands:
+                hands = [self._to_full_frame(hand, x0, y0) for hand in crop_hands]
+                self.roi_frames += 1
+                self.frames_since_full += 1
+            else:
+                self.roi_misses += 1
+
+        if not hands:
+            # Hand lost (or time for a full search) - look at the whole frame
+            hands, img = self.detector.findHands(img, draw=draw, flipType=flipType)
+            self.full_frames += 1
+            self.frames_since_full = 0
+
+        self._update_roi(hands, img.shape)
+        return hands, img
+
+    def _to_full_frame(self, hand, x0, y0):
+        """Shift a hand found in the crop back to full-frame coordinates"""
+        lmList = [[x + x0, y + y0, z] for x, y, z in hand["lmList"]]
+        return build_hand(lmList, hand["type"])
+
+    def _update_roi(self, hands, shape):
+        """Pick the crop for the next frame from this frame's hands"""
+        if not hands:
+            self.roi = None
+            return
+
+        height, width = shape[:2]
+
+        # Box around all the hands we are following
+        xmin = min(hand["bbox"][0] for hand in hands)
+        ymin = min(hand["bbox"][1] for hand in hands)
+        xmax = max(hand["bbox"][0] + hand["bbox"][2] for hand in hands)
+        ymax = max(hand["bbox"][1] + hand["bbox"][3] for hand in hands)
+
+        # Keep the crop where it is while the hands stay well inside it, so the
+        # detector's own frame-to-frame tracking sees a steady image
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            pad_x = int((xmax - xmin) * self.margin / 3)
+            pad_y = int((ymax - ymin) * self.margin / 3)
+            if (xmin - pad_x >= x0 and ymin - pad_y >= y0 and
+                    xmax + pad_x <= x1 and ymax + pad_y <= y1):
+                return
+
+        # Enlarge the box and make sure it is not too small
+        box_w = max(int((xmax - xmin) * (1 + 2 * self.margin)), self.min_size)
+        box_h = max(int((ymax - ymin) * (1 + 2 * self.margin)), self.min_size)
+        cx, cy = (xmin + xmax) // 2, (ymin + ymax) // 2
+
+        # Slide the crop back inside the frame instead of cutting it short
+        x0 = max(0, min(cx - box_w // 2, width - box_w))
+        y0 = max(0, min(cy - box_h // 2, height - box_h))
+        x1 = min(width, x0 + box_w)
+        y1 = min(height, y0 + box_h)
+        self.roi = (x0, y0, x1, y1)
+
+    def fingersUp(self, myHand):
+        """Count fingers up using the wrapped detector"""
+        return self.detector.fingersUp(myHand)
+
+    def findDistance(self, p1, p2, img=None, color=(255, 0, 255), scale=5):
+        """Distance between two points using the wrapped detector"""
+        return self.detector.findDistance(p1, p2, img, color=color, scale=scale)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Scaled Hand Detector
+- Runs hand detection on a downscaled copy of the frame
+- Rescales landmarks back to the full-resolution frame automatically
+- Overlays are drawn on the full-resolution frame
+- Resize and BGR-to-RGB write into reused buffers (frame_buffers.py) and feed
+  MediaPipe directly, instead of allocating new images every frame
+  (detectors without the MediaPipe Hands object go through findHands)
+- Drop-in replacement for HandDetector (findHands / fingersUp / findDistance)
+"""
+
+import cv2
+
+from frame_buffers import FramePreprocessor
+from hand_utils import build_hand, draw_hand, hands_from_results
+
+
+class ScaledHandDetector:
+    """Wrap a HandDetector and run inference at a lower resolution"""
+
+    def __init__(self, detector, scale=0.5):
+        self.detector = detector
+        self.scale = scale  # Inference size relative to the captured frame (1.0 = full size)
+        self.preprocess = FramePreprocessor()
+
+    def findHands(self, img, draw=True, flipType=True):
+        """Return (hands, img) with landmarks in full-resolution coordinates"""
+        height, width = img.shape[:2]
+
+        process = getattr(getattr(self.detector, "hands", None), "process", None)
+        if process is not None:
+            # Resize and colour convert into reused buffers, then run MediaPipe on the result
+            rgb = self.preprocess.to_rgb(img, self.scale)
+            results = process(rgb)
+            self.detector.results = results  # fingersUp reads the latest results
+            hands = hands_from_results(results, width, height, flipType)
+            if draw:
+                for hand in hands:
+                    draw_hand(img, hand)
+            return hands, img
+
+        if self.scale >= 1.0:
+            return self.detector.findHands(img, draw=draw, flipType=flipType)
+
+        small_w = max(1, int(width * self.scale))
+        small_h = max(1, int(height * self.scale))
+        small = cv2.resize(img, (small_w, small_h), interpolation=cv2.INTER_AREA)
+
+        # Never draw on the small copy - overlays go on the full frame below
+        small_hands, _ = self.detector.findHands(small, draw=False, flipType=flipType)
+
+        sx = width / small_w
+        sy = height / small_h
+        hands = []
+        for hand in small_hands:
+            lmList = [[int(x * sx), int(y * sy), int(z * sx)] for x, y, z in hand["lmList"]]
+            hands.append(build_hand(lmList, hand["type"]))
+
+        if draw:
+            for hand in hands:
+                draw_hand(img, hand)
+
+        return hands, img
+
+    def fingersUp(self, myHand):
+        """Count fingers up using the wrapped detector"""
+        return self.detector.fingersUp(myHand)
+
+    def findDistance(self, p1, p2, img=None, color=(255, 0, 255), scale=5):
+        """Distance between two points using the wrapped detector"""
+        return self.detector.findDistance(p1, p2, img, color=color, scale=scale)
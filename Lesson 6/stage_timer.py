@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Stage Timer
+- Measures how long each stage of the vision loop takes (capture, detect, draw...)
+- Call lap("stage") after each stage and end_frame() at the end of the loop
+- report() prints the average time per stage and its share of the frame
+"""
+
+from collections import defaultdict
+from time import perf_counter
+
+
+class StageTimer:
+    """Per-stage timing breakdown for a frame loop"""
+
+    def __init__(self):
+        self.totals = defaultdict(float)  # Total seconds spent in each stage
+        self.current = {}                 # Seconds per stage in the current frame
+        self.frames = 0
+        self.started = perf_counter()
+        self.last = self.started
+
+    def start_frame(self):
+        """Mark the start of a new frame"""
+        self.current = {}
+        self.last = perf_counter()
+
+    def lap(self, stage):
+        """Add the time since the previous lap to the given stage"""
+        now = perf_counter()
+        self.totals[stage] += now - self.last
+        self.current[stage] = self.current.get(stage, 0.0) + now - self.last
+        self.last = now
+
+    def end_frame(self):
+        """Count a finished frame"""
+        self.frames += 1
+
+    def report(self):
+        """Return the timing breakdown as a printable string"""
+        if self.frames == 0:
+            return "No frames processed"
+
+        elapsed = perf_counter() - self.started
+        frame_total = sum(self.totals.values())
+        lines = [f"{self.frames} frames | {self.frames / elapsed:.1f} FPS | "
+                 f"{frame_total / self.frames * 1000:.1f} ms per frame"]
+        for stage, total in self.totals.items():
+            share = total / frame_total * 100 if frame_total else 0
+            lines.append(f"  {stage:<10} {total / self.frames * 1000:7.2f} ms  {share:5.1f}%")
+        return "\n".join(lines)
+
+    def reset(self):
+        """Start a new measurement window"""
+        self.totals.clear()
+        self.frames = 0
+        self.started = perf_counter()
+        self.last = self.started
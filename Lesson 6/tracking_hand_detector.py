@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tracking Hand Detector
+- Runs the full MediaPipe hand detector only every N frames
+- Moves the 21 landmarks with sparse optical flow on the frames in between
+- Falls back to full detection as soon as tracking quality drops
+- Drop-in replacement for HandDetector (findHands / fingersUp / findDistance)
+"""
+
+import cv2
+import numpy as np
+
+from hand_utils import build_hand, draw_hand
+
+# Lucas-Kanade optical flow settings
+LK_PARAMS = dict(winSize=(21, 21), maxLevel=2,
+                 criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03))
+
+
+class TrackingHandDetector:
+    """Wrap a HandDetector and track landmarks between full detections"""
+
+    def __init__(self, detector, detect_every=3, min_tracked=0.8, max_error=20.0):
+        self.detector = detector
+        self.detect_every = detect_every  # Full detection every N frames
+        self.min_tracked = min_tracked    # Fraction of landmarks that must be tracked
+        self.max_error = max_error        # Largest optical flow error accepted per landmark
+
+        self.hands = []
+        self.prev_gray = None
+        self.spare_gray = None  # Previous-but-one gray frame, reused as the next conversion target
+        self.frames_since_detect = 0
+
+        # Statistics
+        self.detections = 0
+        self.tracked_frames = 0
+        self.tracking_failures = 0
+
+    def findHands(self, img, draw=True, flipType=True):
+        """Return (hands, img) - detected or tracked depending on the frame"""
+        spare = self.spare_gray
+        if spare is not None and spare.shape != img.shape[:2]:
+            spare = None
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=spare)
+
+        hands = None
+        if self.hands and self.frames_since_detect < self.detect_every:
+            hands = self._track(gray)
+            if hands is None:
+                self.tracking_failures += 1
+
+        if hands is None:
+            # Full detection (also used when there is nothing to track)
+            hands, img = self.detector.findHands(img, draw=draw, flipType=flipType)
+            self.frames_since_detect = 0
+            self.detections += 1
+        else:
+            self.tracked_frames += 1
+            if draw:
+                for hand in hands:
+                    draw_hand(img, hand)
+
+        self.hands = hands
+        self.spare_gray, self.prev_gray = self.prev_gray, gray
+        self.frames_since_detect += 1
+        return hands, img
+
+    def _track(self, gray):
+        """Move the previous landmarks with optical flow, or None if tracking failed"""
+        points = np.array([lm[0:2] for hand in self.hands for lm in hand["lmList"]],
+                          dtype=np.float32).reshape(-1, 1, 2)
+        new_points, status, error = cv2.calcOpticalFlowPyrLK(self.prev_gray, gray,
+                                                             points, None, **LK_PARAMS)
+        if new_points is None:
+            return None
+
+        good = (status.ravel() == 1) & (error.ravel() < self.max_error)
+        new_points = new_points.reshape(-1, 2)
+        points = points.reshape(-1, 2)
+        height, width = gray.shape
+
+        tracked = []
+        for i, hand in enumerate(self.hands):
+            idx = slice(i * 21, (i + 1) * 21)
+            hand_good = good[idx]
+            if hand_good.mean() < self.min_tracked:
+                return None
+
+            # Landmarks that were lost move with the rest of the hand
+            shift = np.median(new_points[idx][hand_good] - points[idx][hand_good], axis=0)
+            hand_points = np.where(hand_good[:, None], new_points[idx], points[idx] + shift)
+            hand_points[:, 0] = np.clip(hand_points[:, 0], 0, width - 1)
+            hand_points[:, 1] = np.clip(hand_points[:, 1], 0, height - 1)
+
+            lmList = [[int(x), int(y), lm[2]]
+                      for (x, y), lm in zip(hand_points, hand["lmList"])]
+            tracked.append(build_hand(lmList, hand["type"]))
+
+        return tracked
+
+    def fingersUp(self, myHand):
+        """Count fingers up using the wrapped detector"""
+        return self.detector.fingersUp(myHand)
+
+    def findDistance(self, p1, p2, img=None, color=(255, 0, 255), scale=5):
+        """Distance between two points using the wrapped detector"""
+        return self.detector.findDistance(p1, p2, img, color=color, scale=scale)
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Resident Hand Detection Server
+- Keeps one warm HandDetector loaded, so controller scripts do not rebuild
+  the MediaPipe graph every time they start
+- Clients connect over a Unix socket, put their frame in a shared memory
+  buffer they own and get the landmarks back - the pixels are never sent
+- VisionClient is a drop-in replacement for HandDetector
+  (findHands / fingersUp / findDistance)
+- connect_hand_detector() uses the server when it is running and loads a local
+  HandDetector otherwise, so the controller scripts work either way
+- One client at a time (MediaPipe tracks hands from frame to frame, so two
+  interleaved camera streams would confuse it) - a second client is told the
+  server is busy and loads its own model, as it does when the server is down
+  or does not answer in time
+- Clients must ask for the same HandDetector settings the server was started
+  with, otherwise they are turned away and load a model with their settings
+- A bad request gets an error reply; it does not stop the server
+- Private to the user running the server: the socket lives in $XDG_RUNTIME_DIR
+  (mode 0600), both sides prove they know a random key kept in
+  ~/.config/hand_vision/authkey (mode 0600) before anything is unpickled, and
+  clients refuse a socket that belongs to another user
+
+Usage:
+    python3 vision_server.py &                # load the model once
+    python3 hand_tracking_led_control.py      # attaches in milliseconds
+    python3 hand_tracking_motor_control.py    # ...and so does the next one
+"""
+
+import argparse
+import atexit
+import math
+import os
+import signal
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from time import perf_counter
+
+import numpy as np
+
+from fast_start import DETECTOR_DEFAULTS, StartupProfiler, load_hand_detector, warm_up
+from hand_utils import build_hand, draw_hand, fingers_up
+from pipeline_runner import SharedArray
+
+CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".config", "hand_vision")
+KEY_PATH = os.path.join(CONFIG_DIR, "authkey")
+HELLO_TIMEOUT = 1.0  # Seconds to wait for the server to accept us before loading a local model
+REPLY_TIMEOUT = 5.0  # Seconds to wait for one detection
+
+
+def socket_path():
+    """Default socket path: $XDG_RUNTIME_DIR (private to the user), else the config directory"""
+    return os.path.join(os.environ.get("XDG_RUNTIME_DIR") or CONFIG_DIR, "hand_vision.sock")
+
+
+def check_owner(path, private=False):
+    """Refuse a file that belongs to another user (or that others can read, if private)"""
+    st = os.stat(path)
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"{path} belongs to another user")
+    if private and st.st_mode & 0o077:
+        raise PermissionError(f"{path} is readable by other users (chmod 600 it)")
+
+
+def load_authkey(create=False):
+    """Read the shared secret, creating a random one first if asked to"""
+    if create and not os.path.exists(KEY_PATH):
+        os.makedirs(CONFIG_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(os.urandom(32))
+    check_owner(KEY_PATH, private=True)
+    with open(KEY_PATH, "rb") as f:
+        return f.read()
+
+
+def serve_client(conn, detector, settings):
+    """Answer one client's requests until it disconnects"""
+    from multiprocessing import resource_tracker
+
+    frames = None
+    served = 0
+    start = perf_counter()
+    try:
+        message = conn.recv()
+        if message[0] != "hello":
+            conn.send(("error", f"expected hello, got {message[0]!r}"))
+            return
+        wrong = {key: value for key, value in message[1].items() if settings.get(key) != value}
+        if wrong:
+            conn.send(("mismatch", settings))
+            print(f"Client turned away: wants {wrong}")
+            return
+        conn.send(("ok", settings))
+
+        while True:
+            message = conn.recv()
+            try:
+                if message[0] == "attach":
+                    # The client owns the frame buffer - attach to it without taking ownership
+                    if frames is not None:
+                        frames.close()
+                        frames = None
+                    frames = SharedArray.attach(message[1])
+                    resource_tracker.unregister(frames.shm._name, "shared_memory")
+                    conn.send(("ok",))
+
+                elif message[0] == "detect":
+                    if frames is None:
+                        raise ValueError("detect before attach")
+                    # The frame fills the start of the buffer (the buffer only ever grows)
+                    _, flipType, shape = message
+                    img = frames.array[:int(np.prod(shape))].reshape(shape)
+                    hands, _ = detector.findHands(img, draw=False, flipType=flipType)
+                    conn.send(("hands", [(hand["type"], hand["lmList"]) for hand in hands]))
+                    served += 1
+
+                else:
+                    raise ValueError(f"unknown request {message[0]!r}")
+            except Exception as e:
+                # A bad request only fails that request
+                conn.send(("error", f"{type(e).__name__}: {e}"))
+    except (EOFError, OSError):
+        pass  # Client disconnected (or died)
+    finally:
+        if frames is not None:
+            frames.close()
+        conn.close()
+        elapsed = perf_counter() - start
+        print(f"Client done: {served} frames in {elapsed:.1f}s")
+
+
+def serve(detector, address, settings, authkey):
+    """Serve one client at a time until stopped, telling the others the server is busy"""
+    if os.path.exists(address):
+        os.unlink(address)
+    os.makedirs(os.path.dirname(address), mode=0o700, exist_ok=True)
+    # Create the socket as 0600 straight away (no window where others could connect)
+    old_umask = os.umask(0o177)
+    try:
+        listener = Listener(address, family="AF_UNIX", authkey=authkey)
+    finally:
+        os.umask(old_umask)
+    print(f"Hand detection server ready on {address}")
+
+    active = None
+    try:
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, OSError) as e:
+                print(f"Client rejected: {e}")
+                continue
+
+            if active is not None and active.is_alive():
+                try:
+                    conn.send(("busy",))
+                except OSError:
+                    pass
+                conn.close()
+                continue
+            active = threading.Thread(target=serve_client, args=(conn, detector, settings), daemon=True)
+            active.start()
+    finally:
+        listener.close()
+        if os.path.exists(address):
+            os.unlink(address)
+
+
+class VisionClient:
+    """HandDetector look-alike that sends frames to the resident server"""
+
+    def __init__(self, address=None, authkey=None, settings=None):
+        address = address or socket_path()
+        # Never talk to a socket someone else put there
+        check_owner(address)
+        start = perf_counter()
+        self.conn = Client(address, family="AF_UNIX", authkey=authkey or load_authkey())
+        self.frames = None
+        self.local = None  # Local HandDetector, loaded if the server stops answering
+        self.errors = 0    # Frames the server failed on (skipped with no hands)
+        self.requested = dict(DETECTOR_DEFAULTS, **(settings or {}))
+        atexit.register(self.close)  # Free the shared frame buffer even if the script never calls close()
+
+        reply = self._request(("hello", self.requested), HELLO_TIMEOUT)
+        if reply[0] == "busy":
+            self.close()
+            raise ConnectionRefusedError("server is busy with another client")
+        if reply[0] == "mismatch":
+            self.close()
+            raise ValueError(f"server runs different settings {reply[1]}")
+        self.settings = reply[1]
+        self.attach_time = perf_counter() - start
+
+    def _request(self, message, timeout=REPLY_TIMEOUT):
+        """Send a request and wait at most timeout seconds for the reply"""
+        if self.conn.closed:
+            raise ConnectionError("not connected to the hand detection server")
+        self.conn.send(message)
+        if not self.conn.poll(timeout):
+            # A late reply would be taken as the answer to the next request - drop the connection
+            self.close()
+            raise TimeoutError(f"no reply from the hand detection server in {timeout}s")
+        reply = self.conn.recv()
+        if reply[0] == "error":
+            raise RuntimeError(f"hand detection server: {reply[1]}")
+        return reply
+
+    def _attach(self, size):
+        """Create a shared frame buffer of this many bytes and hand it to the server"""
+        if self.frames is not None:
+            self.frames.close()
+        self.frames = SharedArray((size,), np.uint8)
+        try:
+            self._request(("attach", self.frames.spec()))
+        except RuntimeError:
+            # The server did not take the buffer - attach again on the next frame
+            self.frames.close()
+            self.frames = None
+            raise
+
+    def findHands(self, img, draw=True, flipType=True):
+        """Return (hands, img) like HandDetector.findHands"""
+        if self.local is None:
+            try:
+                return self._find_hands(img, draw, flipType)
+            except RuntimeError as e:
+                # The server could not process this frame (it is still running) - no hands this time
+                if self.errors == 0:
+                    print(f"{e} - frame skipped")
+                self.errors += 1
+                return [], img
+            except (EOFError, OSError) as e:
+                print(f"Hand detection server lost ({e}) - loading the model here")
+                self.close()
+                self.local = load_hand_detector(**self.requested)
+        return self.local.findHands(img, draw=draw, flipType=flipType)
+
+    def _find_hands(self, img, draw, flipType):
+        """Detect on the server"""
+        # Frames of any size up to the buffer size share it (ROI crops change size often)
+        if self.frames is None or self.frames.shape[0] < img.size:
+            self._attach(img.size)
+        self.frames.array[:img.size].reshape(img.shape)[:] = img
+        _, found = self._request(("detect", flipType, img.shape))
+
+        hands = [build_hand(lmList, hand_type) for hand_type, lmList in found]
+        if draw:
+            for hand in hands:
+                draw_hand(img, hand)
+        return hands, img
+
+    def fingersUp(self, myHand):
+        """Count fingers up (same rules as HandDetector.fingersUp)"""
+        return fingers_up(myHand)
+
+    def findDistance(self, p1, p2, img=None, color=(255, 0, 255), scale=5):
+        """Distance between two points like HandDetector.findDistance, returns (length, info, img)"""
+        import cv2
+
+        x1, y1 = p1
+        x2, y2 = p2
+        cx, cy = (x1 + x2) // 2, (y1 + y2) // 2
+        length = math.hypot(x2 - x1, y2 - y1)
+        info = (x1, y1, x2, y2, cx, cy)
+        if img is not None:
+            cv2.circle(img, (x1, y1), scale, color, cv2.FILLED)
+            cv2.circle(img, (x2, y2), scale, color, cv2.FILLED)
+            cv2.line(img, (x1, y1), (x2, y2), color, max(1, scale // 3))
+            cv2.circle(img, (cx, cy), scale, color, cv2.FILLED)
+        return length, info, img
+
+    def close(self):
+        """Disconnect and free the shared frame buffer"""
+        if self.conn.closed:
+            return
+        self.conn.close()
+        if self.frames is not None:
+            self.frames.close()
+            self.frames = None
+
+
+def connect_hand_detector(address=None, **kwargs):
+    """Connect to the resident server if it is running, otherwise load a local HandDetector"""
+    address = address or socket_path()
+    if os.path.exists(address):
+        try:
+            client = VisionClient(address, settings=kwargs)
+            print(f"Using the hand detection server ({client.attach_time * 1000:.1f}ms to connect)")
+            return client
+        except (OSError, EOFError, ValueError, AuthenticationError) as e:
+            print(f"Hand detection server not answering ({e}) - loading the model here")
+
+    return load_hand_detector(**kwargs)
+
+
+def stop_server(signum, frame):
+    """Turn SIGTERM into the same clean shutdown as Ctrl+C"""
+    raise KeyboardInterrupt
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resident hand detection server")
+    parser.add_argument("--socket", default=socket_path(), help=f"Unix socket path (default: {socket_path()})")
+    parser.add_argument("--model-complexity", type=int, default=1, choices=[0, 1])
+    parser.add_argument("--max-hands", type=int, default=2)
+    args = parser.parse_args()
+
+    startup = StartupProfiler()
+    settings = dict(DETECTOR_DEFAULTS, maxHands=args.max_hands, modelComplexity=args.model_complexity)
+    with startup.step("load hand model"):
+        detector = load_hand_detector(**settings)
+    warm_up(detector, startup)
+    print(startup.report())
+
+    # Stop cleanly (and remove the socket) on SIGTERM as well as Ctrl+C
+    signal.signal(signal.SIGTERM, stop_server)
+    try:
+        serve(detector, args.socket, settings, load_authkey(create=True))
+    except KeyboardInterrupt:
+        print("\nHand detection server stopped")
+
+
+if __name__ == "__main__":
+    main()